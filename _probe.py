@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP probing helpers for the frontend/backend test scripts
+"""
+
+import atexit
+import logging
+import os
+import re
+import socket
+import sys
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import httpx
+
+# Loopback address pinned up front so no request pays a localhost resolver lookup
+HOST = "127.0.0.1"
+FRONTEND_URL = f"http://{HOST}:3000"
+BACKEND_URL = f"http://{HOST}:8000"
+
+# What the checks probe: frontend pages, the landing page's expected markers (matched
+# against raw body bytes) and the backend endpoints that must answer 200
+FRONTEND_PAGES = ("/", "/index.html", "/dashboard.html", "/results.html")
+AZTEC = b"Aztec Protocol"
+CREATE_ACCOUNT = b"Create Account"
+SIGN_IN = b"Sign In"
+LANDING_PAGE = "/index.html"
+LANDING_NEEDLES = (CREATE_ACCOUNT, SIGN_IN, AZTEC)
+BACKEND_ENDPOINTS = ("/health", "/api/v1/")
+
+def configure_logging():
+    """Send probe output to stdout as bare messages; PROBE_LOG_LEVEL=WARNING keeps only failures"""
+    logging.basicConfig(
+        level=os.environ.get("PROBE_LOG_LEVEL", "INFO").upper(), format="%(message)s", stream=sys.stdout
+    )
+    # httpx logs every request at INFO; the scripts report their own results
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Pool sized to the widest fan-out (test_frontend's four pages) with every connection kept
+# alive; extra requests wait for a free connection instead of opening throwaway ones
+MAX_CONNECTIONS = 4
+LIMITS = httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS)
+TIMEOUT = 5.0
+
+# One process-wide keep-alive client; HTTP/2 is used wherever the server negotiates it.
+# No retries, so a dead server fails fast. Loopback bandwidth is free, so ask for
+# uncompressed bodies and skip the inflate pass
+CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(http2=True, limits=LIMITS, retries=0),
+    timeout=TIMEOUT,
+    headers={"Accept-Encoding": "identity"}
+)
+atexit.register(CLIENT.close)
+
+@lru_cache(maxsize=8)
+def _needle_pattern(needles):
+    """One compiled alternation so a multi-needle scan walks each chunk once"""
+    return re.compile(b"|".join(map(re.escape, needles)))
+
+def scan_body(response, needles):
+    """Stream a response body until every needle is seen; return (bytes read, needles found)"""
+    found = set()
+    size = 0
+    tail = b""
+    overlap = max(map(len, needles)) - 1  # keep enough bytes to match across chunk boundaries
+    pattern = _needle_pattern(needles) if len(needles) > 1 else None
+    for chunk in response.iter_bytes(8192):
+        size += len(chunk)
+        window = tail + chunk
+        if pattern is None:
+            if needles[0] in window:
+                found.add(needles[0])
+        else:
+            found.update(pattern.findall(window))
+        if len(found) == len(needles):
+            break
+        tail = window[-overlap:]
+    return size, found
+
+def fetch(url, needles=()):
+    """GET a page and scan it for needles; return (response, bytes read, needles found) or the exception"""
+    try:
+        with CLIENT.stream("GET", url) as response:
+            if response.status_code != 200 or not needles:
+                return response, 0, set()
+            return (response, *scan_body(response, needles))
+    except Exception as e:
+        return e
+
+def _body_end(data, pos, headers):
+    """Offset just past the body that starts at pos, sized by Content-Length or chunked framing"""
+    if headers.get(b"transfer-encoding", b"").lower() == b"chunked":
+        while True:
+            line_end = data.index(b"\r\n", pos)
+            size = int(data[pos:line_end].split(b";")[0], 16)
+            pos = line_end + 2
+            if size == 0:
+                return data.index(b"\r\n\r\n", pos - 2) + 4
+            pos += size + 2
+    if b"content-length" in headers:
+        return pos + int(headers[b"content-length"])
+    return len(data)  # delimited by the server closing the connection
+
+def _pipeline_once(port, paths):
+    """Send every GET down one connection back to back; return the status codes of the complete replies"""
+    last = len(paths) - 1
+    request = b"".join(
+        b"GET %s HTTP/1.1\r\nHost: %s:%d\r\n%s\r\n"
+        % (path.encode(), HOST.encode(), port, b"Connection: close\r\n" if i == last else b"")
+        for i, path in enumerate(paths)
+    )
+    with socket.create_connection((HOST, port), timeout=TIMEOUT) as sock:
+        sock.sendall(request)
+        data = bytearray()
+        while chunk := sock.recv(65536):
+            data += chunk
+    
+    statuses = []
+    pos = 0
+    try:
+        for _ in paths:
+            head_end = data.index(b"\r\n\r\n", pos)
+            status_line, *lines = bytes(data[pos:head_end]).split(b"\r\n")
+            headers = {}
+            for line in lines:
+                name, _, value = line.partition(b":")
+                headers[name.strip().lower()] = value.strip()
+            end = _body_end(data, head_end + 4, headers)
+            if end > len(data):
+                break
+            statuses.append(int(status_line.split(b" ", 2)[1]))
+            pos = end
+    except ValueError:
+        pass  # connection closed mid-stream: the rest are re-sent
+    return statuses
+
+def _pipeline(port, paths):
+    """Status codes for paths on one port, reconnecting whenever the server closes early (e.g. HTTP/1.0)"""
+    statuses = []
+    while len(statuses) < len(paths):
+        replies = _pipeline_once(port, paths[len(statuses):])
+        if not replies:
+            raise ConnectionError(f"No HTTP response from {HOST}:{port}")
+        statuses += replies
+    return statuses
+
+def probe_all(urls):
+    """Return each URL's status code, or the exception that prevented it, in order.
+    
+    URLs sharing a port are pipelined over one HTTP/1.1 connection, one connection per port.
+    """
+    by_port = {}
+    for index, url in enumerate(urls):
+        parts = urlsplit(url)
+        by_port.setdefault(parts.port, []).append((index, parts.path or "/"))
+    
+    results = [None] * len(urls)
+    
+    def run(port, entries):
+        try:
+            statuses = _pipeline(port, [path for _, path in entries])
+        except Exception as e:
+            statuses = [e] * len(entries)
+        for (index, _), status in zip(entries, statuses):
+            results[index] = status
+    
+    with ThreadPoolExecutor(max_workers=len(by_port)) as executor:
+        for future in [executor.submit(run, port, entries) for port, entries in by_port.items()]:
+            future.result()
+    return results
@@ -0,0 +1,123 @@
+"""Baseline schema
+
+Creates the initial tables. Databases whose tables were created by
+Base.metadata.create_all() before migrations existed should be stamped
+at this revision instead of upgrading through it:
+
+    alembic stamp 0001
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True)
+    ]
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("username", sa.String(length=50), nullable=False),
+        sa.Column("email", sa.String(length=100), nullable=False),
+        sa.Column("hashed_password", sa.String(length=255), nullable=False),
+        sa.Column("full_name", sa.String(length=100), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("is_superuser", sa.Boolean(), nullable=True),
+        *_timestamps()
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "agents",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("agent_type", sa.String(length=50), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=True),
+        sa.Column("config", sa.Text(), nullable=True),
+        sa.Column("performance_metrics", sa.Text(), nullable=True),
+        *_timestamps(),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False)
+    )
+    op.create_index("ix_agents_id", "agents", ["id"])
+
+    op.create_table(
+        "rounds",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=True),
+        sa.Column("bounty_amount", sa.Float(), nullable=True),
+        sa.Column("min_participants", sa.Integer(), nullable=True),
+        sa.Column("max_participants", sa.Integer(), nullable=True),
+        sa.Column("start_time", sa.DateTime(), nullable=True),
+        sa.Column("end_time", sa.DateTime(), nullable=True),
+        *_timestamps(),
+        sa.Column("creator_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False)
+    )
+    op.create_index("ix_rounds_id", "rounds", ["id"])
+
+    op.create_table(
+        "models",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("model_type", sa.String(length=50), nullable=False),
+        sa.Column("architecture", sa.String(length=100), nullable=True),
+        sa.Column("parameters", sa.Integer(), nullable=True),
+        sa.Column("file_size", sa.Integer(), nullable=True),
+        sa.Column("ipfs_hash", sa.String(length=255), nullable=True),
+        sa.Column("accuracy", sa.Float(), nullable=True),
+        sa.Column("loss", sa.Float(), nullable=True),
+        sa.Column("training_config", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=True),
+        *_timestamps(),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("agent_id", sa.Integer(), sa.ForeignKey("agents.id"), nullable=True)
+    )
+    op.create_index("ix_models_id", "models", ["id"])
+
+    op.create_table(
+        "proofs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("proof_type", sa.String(length=50), nullable=False),
+        sa.Column("proof_hash", sa.String(length=255), nullable=False, unique=True),
+        sa.Column("proof_data", sa.Text(), nullable=True),
+        sa.Column("ipfs_hash", sa.String(length=255), nullable=True),
+        sa.Column("verification_status", sa.String(length=20), nullable=True),
+        sa.Column("verification_result", sa.Boolean(), nullable=True),
+        sa.Column("verification_time", sa.Float(), nullable=True),
+        sa.Column("circuit_name", sa.String(length=100), nullable=True),
+        sa.Column("public_inputs", sa.Text(), nullable=True),
+        sa.Column("private_inputs", sa.Text(), nullable=True),
+        *_timestamps(),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("agent_id", sa.Integer(), sa.ForeignKey("agents.id"), nullable=True),
+        sa.Column("model_id", sa.Integer(), sa.ForeignKey("models.id"), nullable=True),
+        sa.Column("round_id", sa.Integer(), sa.ForeignKey("rounds.id"), nullable=True)
+    )
+    op.create_index("ix_proofs_id", "proofs", ["id"])
+
+
+def downgrade():
+    op.drop_table("proofs")
+    op.drop_table("models")
+    op.drop_table("rounds")
+    op.drop_table("agents")
+    op.drop_table("users")
@@ -0,0 +1,24 @@
+"""Add models.file_path
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("models") as batch_op:
+        batch_op.add_column(sa.Column("file_path", sa.String(length=500), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("models") as batch_op:
+        batch_op.drop_column("file_path")
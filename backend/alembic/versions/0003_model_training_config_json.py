@@ -0,0 +1,37 @@
+"""Store models.training_config as JSON (JSONB on PostgreSQL)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "ALTER TABLE models ALTER COLUMN training_config "
+            "TYPE JSONB USING training_config::jsonb"
+        )
+    else:
+        # Existing rows already hold JSON text, which the JSON type reads as-is
+        with op.batch_alter_table("models") as batch_op:
+            batch_op.alter_column("training_config", type_=sa.JSON(), existing_nullable=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "ALTER TABLE models ALTER COLUMN training_config "
+            "TYPE TEXT USING training_config::text"
+        )
+    else:
+        with op.batch_alter_table("models") as batch_op:
+            batch_op.alter_column("training_config", type_=sa.Text(), existing_nullable=True)
@@ -0,0 +1,23 @@
+"""Add (user_id, id) indexes on models and proofs
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_models_user_id_id", "models", ["user_id", "id"])
+    op.create_index("ix_proofs_user_id_id", "proofs", ["user_id", "id"])
+
+
+def downgrade():
+    op.drop_index("ix_proofs_user_id_id", table_name="proofs")
+    op.drop_index("ix_models_user_id_id", table_name="models")
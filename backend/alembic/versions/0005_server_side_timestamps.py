@@ -0,0 +1,35 @@
+"""Default created_at/updated_at on the database clock
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+TABLES = ("users", "agents", "models", "proofs", "rounds")
+
+
+def upgrade():
+    # updated_at is bumped by the UPDATE statements themselves (onupdate=func.now())
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            for column in ("created_at", "updated_at"):
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    server_default=sa.text("CURRENT_TIMESTAMP")
+                )
+
+
+def downgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            for column in ("created_at", "updated_at"):
+                batch_op.alter_column(column, existing_type=sa.DateTime(), server_default=None)
@@ -0,0 +1,39 @@
+"""Add status/foreign-key indexes on agents, models, proofs and rounds
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+PENDING = sa.text("verification_status = 'pending'")
+
+
+def upgrade():
+    op.create_index("ix_agents_user_status", "agents", ["user_id", "status"])
+    op.create_index("ix_models_user_status", "models", ["user_id", "status"])
+    op.create_index("ix_models_agent_status", "models", ["agent_id", "status"])
+    op.create_index("ix_proofs_user_created", "proofs", ["user_id", "created_at"])
+    op.create_index("ix_proofs_round_status", "proofs", ["round_id", "verification_status"])
+    op.create_index(
+        "ix_proofs_pending", "proofs", ["created_at"],
+        postgresql_where=PENDING, sqlite_where=PENDING
+    )
+    op.create_index("ix_rounds_creator_status", "rounds", ["creator_id", "status"])
+
+
+def downgrade():
+    op.drop_index("ix_rounds_creator_status", table_name="rounds")
+    op.drop_index("ix_proofs_pending", table_name="proofs")
+    op.drop_index("ix_proofs_round_status", table_name="proofs")
+    op.drop_index("ix_proofs_user_created", table_name="proofs")
+    op.drop_index("ix_models_agent_status", table_name="models")
+    op.drop_index("ix_models_user_status", table_name="models")
+    op.drop_index("ix_agents_user_status", table_name="agents")
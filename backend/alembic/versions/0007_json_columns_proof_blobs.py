@@ -0,0 +1,72 @@
+"""Store JSON payloads as JSON/JSONB and move proofs.private_inputs to proof_blobs
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = {
+    "agents": ("config", "performance_metrics"),
+    "proofs": ("proof_data", "public_inputs")
+}
+
+
+def _is_postgres():
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def _json_type():
+    return JSONB() if _is_postgres() else sa.JSON()
+
+
+def _retype(table, columns, type_, cast):
+    """Change the type of text/JSON columns, casting in place on PostgreSQL"""
+    if _is_postgres():
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {cast} USING {column}::{cast}")
+    else:
+        # Existing rows already hold JSON text, which the JSON type reads as-is
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, type_=type_, existing_nullable=True)
+
+
+def upgrade():
+    for table, columns in JSON_COLUMNS.items():
+        _retype(table, columns, sa.JSON(), "jsonb")
+    
+    op.create_table(
+        "proof_blobs",
+        sa.Column("proof_id", sa.Integer(), sa.ForeignKey("proofs.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("private_inputs", _json_type(), nullable=True)
+    )
+    cast = "::jsonb" if _is_postgres() else ""
+    op.execute(
+        f"INSERT INTO proof_blobs (proof_id, private_inputs) "
+        f"SELECT id, private_inputs{cast} FROM proofs WHERE private_inputs IS NOT NULL"
+    )
+    with op.batch_alter_table("proofs") as batch_op:
+        batch_op.drop_column("private_inputs")
+
+
+def downgrade():
+    with op.batch_alter_table("proofs") as batch_op:
+        batch_op.add_column(sa.Column("private_inputs", sa.Text(), nullable=True))
+    cast = "::text" if _is_postgres() else ""
+    op.execute(
+        f"UPDATE proofs SET private_inputs = ("
+        f"SELECT private_inputs{cast} FROM proof_blobs WHERE proof_blobs.proof_id = proofs.id)"
+    )
+    op.drop_table("proof_blobs")
+    
+    for table, columns in JSON_COLUMNS.items():
+        _retype(table, columns, sa.Text(), "text")
@@ -0,0 +1,22 @@
+"""Track proof IPFS upload status on the proofs row
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("proofs", sa.Column("ipfs_status", sa.String(length=20), nullable=True))
+
+
+def downgrade():
+    op.drop_column("proofs", "ipfs_status")
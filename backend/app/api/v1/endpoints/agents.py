@@ -2,14 +2,14 @@
 Agent endpoints for Aztec Protocol Backend
 """
 
-import json
 import os
+import tomllib
 from typing import List, Any
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import select, insert, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_async_db, get_async_ro_db
 from app.core.security import get_current_active_user
 from app.models.user import User
 from app.models.agent import Agent
@@ -18,38 +18,54 @@ from app.core.config import settings
 
 router = APIRouter()
 
+# Owner-scoped lookup by id, built once and reused by every handler
+_AGENT_BY_ID_AND_USER = select(Agent).where(
+    Agent.id == bindparam("agent_id"),
+    Agent.user_id == bindparam("user_id")
+)
+
+# 404 for owner-scoped lookups that miss. A fresh exception per raise: re-raising one
+# shared instance keeps growing its traceback and pins every failed request's frames
+def _agent_not_found() -> HTTPException:
+    return HTTPException(status_code=404, detail="Agent not found")
+
 
 @router.get("/", response_model=List[AgentResponse])
 async def list_agents(
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """List all agents for the current user"""
-    agents = db.query(Agent).filter(
-        Agent.user_id == current_user.id
-    ).offset(skip).limit(limit).all()
-    return agents
+    result = await db.execute(
+        select(Agent)
+        .where(Agent.user_id == current_user.id)
+        .order_by(Agent.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    return result.scalars().all()
 
 
 @router.post("/", response_model=AgentResponse)
 async def create_agent(
     agent: AgentCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Create a new agent"""
-    db_agent = Agent(
-        name=agent.name,
-        description=agent.description,
-        agent_type=agent.agent_type,
-        config=json.dumps(agent.dict()),
-        user_id=current_user.id
+    result = await db.execute(
+        insert(Agent).values(
+            name=agent.name,
+            description=agent.description,
+            agent_type=agent.agent_type,
+            config=agent.model_dump(),
+            user_id=current_user.id
+        ).returning(Agent)
     )
-    db.add(db_agent)
-    db.commit()
-    db.refresh(db_agent)
+    db_agent = result.scalar_one()
+    await db.commit()
     return db_agent
 
 
@@ -57,15 +73,14 @@ async def create_agent(
 async def get_agent(
     agent_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """Get a specific agent"""
-    agent = db.query(Agent).filter(
-        and_(Agent.id == agent_id, Agent.user_id == current_user.id)
-    ).first()
-    if not agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
-    return agent
+    result = await db.execute(_AGENT_BY_ID_AND_USER, {"agent_id": agent_id, "user_id": current_user.id})
+    db_agent = result.scalar_one_or_none()
+    if not db_agent:
+        raise _agent_not_found()
+    return db_agent
 
 
 @router.put("/{agent_id}", response_model=AgentResponse)
@@ -73,24 +88,20 @@ async def update_agent(
     agent_id: int,
     agent_update: AgentUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Update an agent"""
-    db_agent = db.query(Agent).filter(
-        and_(Agent.id == agent_id, Agent.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_AGENT_BY_ID_AND_USER, {"agent_id": agent_id, "user_id": current_user.id})
+    db_agent = result.scalar_one_or_none()
     if not db_agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
+        raise _agent_not_found()
     
-    update_data = agent_update.dict(exclude_unset=True)
+    update_data = agent_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
-        if field == "config" and value:
-            setattr(db_agent, field, json.dumps(value))
-        else:
-            setattr(db_agent, field, value)
+        setattr(db_agent, field, value)
     
-    db.commit()
-    db.refresh(db_agent)
+    await db.commit()
+    await db.refresh(db_agent)
     return db_agent
 
 
@@ -98,17 +109,16 @@ async def update_agent(
 async def delete_agent(
     agent_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Delete an agent"""
-    db_agent = db.query(Agent).filter(
-        and_(Agent.id == agent_id, Agent.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_AGENT_BY_ID_AND_USER, {"agent_id": agent_id, "user_id": current_user.id})
+    db_agent = result.scalar_one_or_none()
     if not db_agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
+        raise _agent_not_found()
     
-    db.delete(db_agent)
-    db.commit()
+    await db.delete(db_agent)
+    await db.commit()
     return {"message": "Agent deleted successfully"}
 
 
@@ -116,18 +126,17 @@ async def delete_agent(
 async def start_agent(
     agent_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Start an agent training round"""
-    db_agent = db.query(Agent).filter(
-        and_(Agent.id == agent_id, Agent.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_AGENT_BY_ID_AND_USER, {"agent_id": agent_id, "user_id": current_user.id})
+    db_agent = result.scalar_one_or_none()
     if not db_agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
+        raise _agent_not_found()
     
     # Update agent status
     db_agent.status = "training"
-    db.commit()
+    await db.commit()
     
     return {
         "message": "Agent training started",
@@ -140,18 +149,17 @@ async def start_agent(
 async def stop_agent(
     agent_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Stop an agent training round"""
-    db_agent = db.query(Agent).filter(
-        and_(Agent.id == agent_id, Agent.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_AGENT_BY_ID_AND_USER, {"agent_id": agent_id, "user_id": current_user.id})
+    db_agent = result.scalar_one_or_none()
     if not db_agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
+        raise _agent_not_found()
     
     # Update agent status
     db_agent.status = "idle"
-    db.commit()
+    await db.commit()
     
     return {
         "message": "Agent training stopped",
@@ -164,17 +172,16 @@ async def stop_agent(
 async def get_agent_status(
     agent_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """Get agent status and performance metrics"""
-    db_agent = db.query(Agent).filter(
-        and_(Agent.id == agent_id, Agent.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_AGENT_BY_ID_AND_USER, {"agent_id": agent_id, "user_id": current_user.id})
+    db_agent = result.scalar_one_or_none()
     if not db_agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
+        raise _agent_not_found()
     
-    config = json.loads(db_agent.config) if db_agent.config else {}
-    performance = json.loads(db_agent.performance_metrics) if db_agent.performance_metrics else {}
+    config = db_agent.config or {}
+    performance = db_agent.performance_metrics or {}
     
     return {
         "agent_id": agent_id,
@@ -193,23 +200,22 @@ async def update_agent_config(
     agent_id: int,
     config: AgentConfig,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Update agent configuration"""
-    db_agent = db.query(Agent).filter(
-        and_(Agent.id == agent_id, Agent.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_AGENT_BY_ID_AND_USER, {"agent_id": agent_id, "user_id": current_user.id})
+    db_agent = result.scalar_one_or_none()
     if not db_agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
+        raise _agent_not_found()
     
     # Update agent config
-    db_agent.config = json.dumps(config.dict())
-    db.commit()
+    db_agent.config = config.model_dump()
+    await db.commit()
     
     return {
         "message": "Agent configuration updated",
         "agent_id": agent_id,
-        "config": config.dict()
+        "config": db_agent.config
     }
 
 
@@ -218,14 +224,13 @@ async def upload_agent_config(
     agent_id: int,
     config_file: UploadFile = File(...),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Upload agent configuration file (aztec-agent.toml)"""
-    db_agent = db.query(Agent).filter(
-        and_(Agent.id == agent_id, Agent.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_AGENT_BY_ID_AND_USER, {"agent_id": agent_id, "user_id": current_user.id})
+    db_agent = result.scalar_one_or_none()
     if not db_agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
+        raise _agent_not_found()
     
     if not config_file.filename.endswith('.toml'):
         raise HTTPException(status_code=400, detail="Configuration file must be a .toml file")
@@ -233,7 +238,6 @@ async def upload_agent_config(
     try:
         # Read and parse TOML config
         content = await config_file.read()
-        import tomllib
         config_data = tomllib.loads(content.decode())
         
         # Extract agent config
@@ -243,9 +247,9 @@ async def upload_agent_config(
         agent_config = config_data["agent"]
         
         # Update agent config
-        db_agent.config = json.dumps(agent_config)
+        db_agent.config = agent_config
         db_agent.name = agent_config.get("agent_name", db_agent.name)
-        db.commit()
+        await db.commit()
         
         return {
             "message": "Agent configuration uploaded successfully",
@@ -262,14 +266,13 @@ async def get_agent_logs(
     agent_id: int,
     lines: int = 100,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """Get agent logs (simulated)"""
-    db_agent = db.query(Agent).filter(
-        and_(Agent.id == agent_id, Agent.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_AGENT_BY_ID_AND_USER, {"agent_id": agent_id, "user_id": current_user.id})
+    db_agent = result.scalar_one_or_none()
     if not db_agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
+        raise _agent_not_found()
     
     # Simulate log retrieval
     logs = [
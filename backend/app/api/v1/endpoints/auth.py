@@ -2,74 +2,92 @@
 Authentication endpoints for Aztec Protocol Backend
 """
 
+import asyncio
 from datetime import timedelta
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select, insert
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError, jwt
 
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import get_async_db, get_async_ro_db
 from app.models.user import User
+from app.models.agent import Agent
 from app.schemas.auth import Token, TokenData, UserCreate, UserResponse
-from app.core.security import create_access_token, get_current_user
+from app.core.security import create_access_token, get_current_user, get_current_active_user
 
 router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
+async def load_user_bundle(db: AsyncSession, user_id: int) -> User:
+    """Load a user with their agents (and each agent's models), models and proofs"""
+    # One SELECT per collection with IN (...) batching, all on the same connection
+    result = await db.execute(
+        select(User)
+        .where(User.id == user_id)
+        .options(
+            selectinload(User.agents).selectinload(Agent.models),
+            selectinload(User.models),
+            selectinload(User.proofs)
+        )
+    )
+    return result.scalar_one()
+
+
 @router.post("/register", response_model=UserResponse)
-async def register(user: UserCreate, db: Session = Depends(get_db)) -> Any:
+async def register(user: UserCreate, db: AsyncSession = Depends(get_async_db)) -> Any:
     """Register a new user"""
     # Check if user already exists
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if db_user:
+    result = await db.execute(select(User.id).where(User.email == user.email))
+    if result.first():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
     # Check username
-    db_user = db.query(User).filter(User.username == user.username).first()
-    if db_user:
+    result = await db.execute(select(User.id).where(User.username == user.username))
+    if result.first():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
         )
     
     # Create new user
-    hashed_password = User.get_password_hash(user.password)
-    db_user = User(
-        username=user.username,
-        email=user.email,
-        hashed_password=hashed_password,
-        full_name=user.full_name
+    # bcrypt is deliberately slow; keep it off the event loop
+    hashed_password = await asyncio.to_thread(User.get_password_hash, user.password)
+    result = await db.execute(
+        insert(User).values(
+            username=user.username,
+            email=user.email,
+            hashed_password=hashed_password,
+            full_name=user.full_name
+        ).returning(User)
     )
+    db_user = result.scalar_one()
+    await db.commit()
     
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-    
-    return UserResponse(
-        id=db_user.id,
-        username=db_user.username,
-        email=db_user.email,
-        full_name=db_user.full_name,
-        is_active=db_user.is_active
-    )
+    # response_model validates the row once on the way out
+    return db_user
 
 
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """Login and get access token"""
     # Authenticate user
-    user = db.query(User).filter(User.username == form_data.username).first()
-    if not user or not User.verify_password(form_data.password, user.hashed_password):
+    result = await db.execute(select(User).where(User.username == form_data.username))
+    user = result.scalar_one_or_none()
+    if not user or not await asyncio.to_thread(
+        User.verify_password, form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -94,13 +112,7 @@ async def login_for_access_token(
 @router.get("/me", response_model=UserResponse)
 async def read_users_me(current_user: User = Depends(get_current_user)) -> Any:
     """Get current user information"""
-    return UserResponse(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        full_name=current_user.full_name,
-        is_active=current_user.is_active
-    )
+    return current_user
 
 
 @router.post("/refresh")
@@ -111,4 +123,40 @@ async def refresh_token(current_user: User = Depends(get_current_user)) -> Any:
         data={"sub": current_user.username}, expires_delta=access_token_expires
     )
     
-    return {"access_token": access_token, "token_type": "bearer"} 
\ No newline at end of file
+    return {"access_token": access_token, "token_type": "bearer"}
+
+
+@router.get("/me/dashboard")
+async def read_users_dashboard(
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_ro_db)
+) -> Any:
+    """Get the current user with their agents, models and proofs"""
+    user = await load_user_bundle(db, current_user.id)
+    
+    return {
+        "user": UserResponse.model_validate(user),
+        "agents": [
+            {
+                "id": agent.id,
+                "name": agent.name,
+                "agent_type": agent.agent_type,
+                "status": agent.status,
+                "model_ids": [model.id for model in agent.models]
+            }
+            for agent in user.agents
+        ],
+        "models": [
+            {"id": model.id, "name": model.name, "model_type": model.model_type, "status": model.status}
+            for model in user.models
+        ],
+        "proofs": [
+            {
+                "id": proof.id,
+                "proof_type": proof.proof_type,
+                "verification_status": proof.verification_status,
+                "ipfs_hash": proof.ipfs_hash
+            }
+            for proof in user.proofs
+        ]
+    }
@@ -3,23 +3,118 @@ Blockchain endpoints for Aztec Protocol Backend
 """
 
 import json
+from itertools import islice
 from typing import List, Any
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
 
-from app.core.database import get_db
 from app.core.security import get_current_active_user
+from app.core.clock import now_iso
+from app.core.hashes import new_tx_hash
 from app.models.user import User
 from app.core.config import settings
+from app.schemas.blockchain import (
+    BlockchainStatusResponse,
+    ContractsResponse,
+    TransactionListResponse,
+    ContractEventListResponse,
+    GasEstimateResponse
+)
 
 router = APIRouter()
 
+# Simulated transaction history ("from" is filled in per request)
+_TX_FIXTURES = (
+    {
+        "hash": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+        "to": settings.CONTRACT_ADDRESSES.get("proof_verifier"),
+        "value": "0",
+        "gas_used": 150000,
+        "gas_price": "20000000000",
+        "block_number": 12346,
+        "timestamp": "2024-01-01T00:00:00Z",
+        "status": "confirmed",
+        "method": "submitProof"
+    },
+    {
+        "hash": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890",
+        "to": settings.CONTRACT_ADDRESSES.get("aztec_orchestrator"),
+        "value": "1000000000000000000",  # 1 ETH
+        "gas_used": 21000,
+        "gas_price": "20000000000",
+        "block_number": 12345,
+        "timestamp": "2024-01-01T00:00:00Z",
+        "status": "confirmed",
+        "method": "transfer"
+    },
+)
 
-@router.get("/status")
+# Simulated contract events ("address" is filled in per request)
+_EVENT_FIXTURES = (
+    {
+        "event": "ProofVerified",
+        "log_index": 0,
+        "transaction_hash": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+        "block_number": 12346,
+        "block_hash": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890",
+        "data": {
+            "agent": "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
+            "proofType": "zk_proofs",
+            "proofHash": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890",
+            "isValid": True,
+            "timestamp": 1704067200
+        }
+    },
+    {
+        "event": "ProofSubmitted",
+        "log_index": 1,
+        "transaction_hash": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890",
+        "block_number": 12345,
+        "block_hash": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+        "data": {
+            "agent": "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
+            "proofType": "zk_proofs",
+            "proofHash": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+            "timestamp": 1704067200
+        }
+    },
+)
+
+# Event fixtures grouped by event name for O(1) event_type filtering
+_EVENTS_BY_TYPE = {
+    name: tuple(event for event in _EVENT_FIXTURES if event["event"] == name)
+    for name in {event["event"] for event in _EVENT_FIXTURES}
+}
+
+
+# Simulated gas table and the estimate fields derived from it
+_GAS_PRICE_WEI = 20000000000  # 20 gwei
+_GAS_TABLE = {
+    "submitProof": 150000,
+    "verifyProof": 100000,
+    "setVerificationThresholds": 80000,
+    "transfer": 21000
+}
+_DEFAULT_GAS = 100000
+
+
+def _gas_response(estimated_gas: int) -> dict:
+    """Build the static part of a gas estimate response"""
+    return {
+        "estimated_gas": estimated_gas,
+        "gas_price": str(_GAS_PRICE_WEI),
+        "estimated_cost_wei": estimated_gas * _GAS_PRICE_WEI,
+        "estimated_cost_eth": (estimated_gas * _GAS_PRICE_WEI) / 1e18
+    }
+
+
+_GAS_RESPONSES = {method: _gas_response(gas) for method, gas in _GAS_TABLE.items()}
+_DEFAULT_GAS_RESPONSE = _gas_response(_DEFAULT_GAS)
+
+
+@router.get("/status", response_model=BlockchainStatusResponse, response_model_exclude_none=True)
 async def get_blockchain_status(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
-) -> Any:
+    current_user: User = Depends(get_current_active_user)
+) -> BlockchainStatusResponse:
     """Get blockchain status and configuration"""
     
     try:
@@ -46,11 +141,10 @@ async def get_blockchain_status(
         }
 
 
-@router.get("/contracts")
+@router.get("/contracts", response_model=ContractsResponse)
 async def get_contract_addresses(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
-) -> Any:
+    current_user: User = Depends(get_current_active_user)
+) -> ContractsResponse:
     """Get deployed contract addresses"""
     
     return {
@@ -79,14 +173,13 @@ async def get_contract_addresses(
 @router.post("/submit-proof")
 async def submit_proof_to_blockchain(
     proof_data: dict,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """Submit a proof to the blockchain for verification"""
     
     try:
         # Simulate blockchain proof submission
-        tx_hash = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
+        tx_hash = new_tx_hash()
         
         # Extract proof information
         proof_type = proof_data.get("proof_type", "zk_proofs")
@@ -104,7 +197,7 @@ async def submit_proof_to_blockchain(
             "gas_used": 150000,
             "gas_price": "20000000000",
             "block_number": 12346,
-            "timestamp": "2024-01-01T00:00:00Z"
+            "timestamp": now_iso()
         }
         
         return {
@@ -120,8 +213,7 @@ async def submit_proof_to_blockchain(
 async def verify_proof_on_blockchain(
     proof_hash: str,
     proof_type: str = "zk_proofs",
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """Verify a proof on the blockchain"""
     
@@ -138,7 +230,7 @@ async def verify_proof_on_blockchain(
                 "epochs_valid": True,
                 "model_params_valid": True
             },
-            "timestamp": "2024-01-01T00:00:00Z"
+            "timestamp": now_iso()
         }
         
         return {
@@ -150,117 +242,55 @@ async def verify_proof_on_blockchain(
         raise HTTPException(status_code=500, detail=f"Proof verification failed: {str(e)}")
 
 
-@router.get("/transactions")
+@router.get("/transactions", response_model=TransactionListResponse)
 async def get_blockchain_transactions(
     address: str = None,
     limit: int = 50,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
-) -> Any:
+    current_user: User = Depends(get_current_active_user)
+) -> TransactionListResponse:
     """Get blockchain transactions for an address"""
     
     # Use provided address or current user's wallet address
     target_address = address or current_user.wallet_address
     
-    # Simulate transaction history
-    transactions = [
-        {
-            "hash": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
-            "from": target_address,
-            "to": settings.CONTRACT_ADDRESSES.get("proof_verifier"),
-            "value": "0",
-            "gas_used": 150000,
-            "gas_price": "20000000000",
-            "block_number": 12346,
-            "timestamp": "2024-01-01T00:00:00Z",
-            "status": "confirmed",
-            "method": "submitProof"
-        },
-        {
-            "hash": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890",
-            "from": target_address,
-            "to": settings.CONTRACT_ADDRESSES.get("aztec_orchestrator"),
-            "value": "1000000000000000000",  # 1 ETH
-            "gas_used": 21000,
-            "gas_price": "20000000000",
-            "block_number": 12345,
-            "timestamp": "2024-01-01T00:00:00Z",
-            "status": "confirmed",
-            "method": "transfer"
-        }
-    ]
-    
     return {
         "address": target_address,
-        "transactions": transactions[:limit],
-        "total": len(transactions)
+        "transactions": [
+            {"from": target_address, **tx}
+            for tx in islice(_TX_FIXTURES, max(limit, 0))
+        ],
+        "total": len(_TX_FIXTURES)
     }
 
 
-@router.get("/events")
+@router.get("/events", response_model=ContractEventListResponse)
 async def get_contract_events(
     contract_address: str = None,
     event_type: str = None,
     from_block: int = 0,
     to_block: int = "latest",
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
-) -> Any:
+    current_user: User = Depends(get_current_active_user)
+) -> ContractEventListResponse:
     """Get contract events"""
     
     # Use provided contract address or default to proof verifier
     target_contract = contract_address or settings.CONTRACT_ADDRESSES.get("proof_verifier")
     
-    # Simulate contract events
-    events = [
-        {
-            "address": target_contract,
-            "event": "ProofVerified",
-            "log_index": 0,
-            "transaction_hash": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
-            "block_number": 12346,
-            "block_hash": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890",
-            "data": {
-                "agent": "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
-                "proofType": "zk_proofs",
-                "proofHash": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890",
-                "isValid": True,
-                "timestamp": 1704067200
-            }
-        },
-        {
-            "address": target_contract,
-            "event": "ProofSubmitted",
-            "log_index": 1,
-            "transaction_hash": "0xabcdef1234567890abcdef1234567890abcdef1234567890abcdef1234567890",
-            "block_number": 12345,
-            "block_hash": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
-            "data": {
-                "agent": "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
-                "proofType": "zk_proofs",
-                "proofHash": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
-                "timestamp": 1704067200
-            }
-        }
-    ]
-    
     # Filter events by type if specified
-    if event_type:
-        events = [event for event in events if event["event"] == event_type]
+    events = _EVENTS_BY_TYPE.get(event_type, ()) if event_type else _EVENT_FIXTURES
     
     return {
         "contract_address": target_contract,
         "from_block": from_block,
         "to_block": to_block,
-        "events": events,
+        "events": [{"address": target_contract, **event} for event in events],
         "total": len(events)
     }
 
 
 @router.post("/deploy-contracts")
 async def deploy_contracts(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """Deploy smart contracts (simulated)"""
     
@@ -289,7 +319,7 @@ async def deploy_contracts(
                     "modelDiffVK": "0xa59d0a98c7ace3099a2f90bf75ec5fa27ca740c6bc555c3ee6e122ba0543288a"
                 }
             },
-            "timestamp": "2024-01-01T00:00:00Z"
+            "timestamp": now_iso()
         }
         
         return {
@@ -301,36 +331,22 @@ async def deploy_contracts(
         raise HTTPException(status_code=500, detail=f"Contract deployment failed: {str(e)}")
 
 
-@router.get("/gas-estimate")
+@router.get("/gas-estimate", response_model=GasEstimateResponse)
 async def estimate_gas(
     contract_address: str,
     method: str,
     params: dict = {},
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
-) -> Any:
+    current_user: User = Depends(get_current_active_user)
+) -> GasEstimateResponse:
     """Estimate gas for a contract method call"""
     
     try:
-        # Simulate gas estimation
-        gas_estimates = {
-            "submitProof": 150000,
-            "verifyProof": 100000,
-            "setVerificationThresholds": 80000,
-            "transfer": 21000
-        }
-        
-        estimated_gas = gas_estimates.get(method, 100000)
-        
         return {
             "contract_address": contract_address,
             "method": method,
             "params": params,
-            "estimated_gas": estimated_gas,
-            "gas_price": "20000000000",  # 20 gwei
-            "estimated_cost_wei": estimated_gas * 20000000000,
-            "estimated_cost_eth": (estimated_gas * 20000000000) / 1e18
+            **_GAS_RESPONSES.get(method, _DEFAULT_GAS_RESPONSE)
         }
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Gas estimation failed: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Gas estimation failed: {str(e)}")
@@ -2,27 +2,150 @@
 IPFS endpoints for Aztec Protocol Backend
 """
 
+import asyncio
 import json
-import os
-import shutil
-from typing import List, Any
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List, Any, Tuple
+import aiofiles
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
-from app.core.database import get_db
 from app.core.security import get_current_active_user
+from app.core.clock import now_iso
+from app.core.http import get_http_client
 from app.models.user import User
 from app.core.config import settings
+from app.core.pinata import pin_file
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Read size used when spooling uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+# Chunk size used when proxying gateway downloads
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Pinata credential status, refreshed in the background by refresh_ipfs_status_loop()
+_IPFS_STATUS = {
+    "credentials_configured": bool(settings.IPFS_API_KEY and settings.IPFS_API_SECRET),
+    "credentials_valid": False,
+    "checked_at": None,
+    "error": None
+}
+
+
+async def _refresh_ipfs_status():
+    """Probe Pinata once and store the result in _IPFS_STATUS"""
+    credentials_valid = False
+    error = None
+    
+    if _IPFS_STATUS["credentials_configured"]:
+        try:
+            url = "https://api.pinata.cloud/data/testAuthentication"
+            headers = {
+                "pinata_api_key": settings.IPFS_API_KEY,
+                "pinata_secret_api_key": settings.IPFS_API_SECRET
+            }
+            response = await get_http_client().get(url, headers=headers, timeout=10)
+            credentials_valid = response.status_code == 200
+        except Exception as e:
+            error = str(e)
+    
+    _IPFS_STATUS.update(
+        credentials_valid=credentials_valid,
+        checked_at=now_iso(),
+        error=error
+    )
+
+
+# CIDv0 (base58btc "Qm...") or CIDv1 (base32 "b...")
+_CID_RE = re.compile(r"^(Qm[1-9A-HJ-NP-Za-km-z]{44}|b[A-Za-z2-7]{58,})$")
+
+
+def _validate_cid(ipfs_hash: str):
+    """Reject malformed CIDs locally instead of round-tripping to Pinata"""
+    if not _CID_RE.match(ipfs_hash):
+        raise HTTPException(status_code=422, detail="Invalid CID")
+
+
+# Gateway HEAD metadata per CID (IPFS content is immutable, so hits never go stale)
+_META_CACHE: "TTLCache[str, Tuple[str, str]]" = TTLCache(maxsize=10_000, ttl=3600)
+_META_INFLIGHT: Dict[str, "asyncio.Task[Tuple[int, str, str]]"] = {}
+
+
+async def _head_ipfs(ipfs_hash: str, ipfs_url: str) -> Tuple[int, str, str]:
+    """HEAD the gateway and cache (content_type, content_length) on success"""
+    response = await get_http_client().head(ipfs_url, timeout=10)
+    content_type = response.headers.get("content-type", "unknown")
+    content_length = response.headers.get("content-length", "unknown")
+    if response.status_code == 200:
+        _META_CACHE[ipfs_hash] = (content_type, content_length)
+    return response.status_code, content_type, content_length
+
+
+async def _get_ipfs_metadata(ipfs_hash: str, ipfs_url: str) -> Tuple[int, str, str]:
+    """Get gateway metadata for a CID, sharing one HEAD between concurrent callers"""
+    cached = _META_CACHE.get(ipfs_hash)
+    if cached is not None:
+        return (200, *cached)
+    
+    task = _META_INFLIGHT.get(ipfs_hash)
+    if task is None:
+        task = asyncio.create_task(_head_ipfs(ipfs_hash, ipfs_url))
+        _META_INFLIGHT[ipfs_hash] = task
+        task.add_done_callback(lambda _: _META_INFLIGHT.pop(ipfs_hash, None))
+    
+    return await asyncio.shield(task)
+
+
+async def stream_from_gateway(ipfs_url: str) -> StreamingResponse:
+    """Proxy gateway bytes to the client without buffering them in memory"""
+    client = get_http_client()
+    response = await client.send(client.build_request("GET", ipfs_url), stream=True)
+    
+    if response.status_code != 200:
+        await response.aclose()
+        raise HTTPException(
+            status_code=502,
+            detail=f"IPFS gateway returned HTTP {response.status_code}"
+        )
+    
+    # Raw bytes are forwarded, so the upstream encoding/length headers stay valid
+    headers = {
+        name: response.headers[name]
+        for name in ("content-length", "content-encoding")
+        if name in response.headers
+    }
+    
+    return StreamingResponse(
+        response.aiter_raw(STREAM_CHUNK_SIZE),
+        media_type=response.headers.get("content-type", "application/octet-stream"),
+        headers=headers,
+        background=BackgroundTask(response.aclose)
+    )
+
+
+async def refresh_ipfs_status_loop():
+    """Refresh Pinata credential status every IPFS_STATUS_REFRESH_SECONDS"""
+    while True:
+        try:
+            await _refresh_ipfs_status()
+        except Exception as e:
+            logger.error(f"IPFS status refresh failed: {e}")
+        await asyncio.sleep(settings.IPFS_STATUS_REFRESH_SECONDS)
+
 
 @router.post("/upload")
 async def upload_to_ipfs(
     file: UploadFile = File(...),
     metadata: str = Form(None),
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """Upload a file to IPFS using Pinata"""
     
@@ -37,26 +160,15 @@ async def upload_to_ipfs(
             detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE / (1024*1024)}MB"
         )
     
+    # Create temporary file
+    temp_file_path = f"temp_{file.filename}"
     try:
-        # Import IPFS upload function from agent
-        import sys
-        sys.path.append('../agent')
-        from ipfs_upload import upload_to_ipfs
-        
-        # Create temporary file
-        temp_file_path = f"temp_{file.filename}"
-        with open(temp_file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        async with aiofiles.open(temp_file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await buffer.write(chunk)
         
         # Upload to IPFS
-        ipfs_hash = upload_to_ipfs(
-            temp_file_path, 
-            settings.IPFS_API_KEY, 
-            settings.IPFS_API_SECRET
-        )
-        
-        # Clean up temporary file
-        os.remove(temp_file_path)
+        ipfs_hash = await pin_file(temp_file_path)
         
         # Parse metadata if provided
         parsed_metadata = None
@@ -76,33 +188,96 @@ async def upload_to_ipfs(
         }
         
     except Exception as e:
-        # Clean up temporary file if it exists
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
         raise HTTPException(status_code=500, detail=f"IPFS upload failed: {str(e)}")
+    finally:
+        # Clean up temporary file
+        Path(temp_file_path).unlink(missing_ok=True)
+
+
+@router.get("/status")
+async def get_ipfs_status(
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    """Get IPFS service status and configuration"""
+    
+    # Credential validity comes from the background probe; no network call here
+    credentials_valid = _IPFS_STATUS["credentials_valid"]
+    error = _IPFS_STATUS["error"]
+    
+    result = {
+        "service": "Pinata IPFS",
+        "api_url": settings.IPFS_API_URL,
+        "gateway_url": "https://gateway.pinata.cloud",
+        "credentials_configured": _IPFS_STATUS["credentials_configured"],
+        "credentials_valid": credentials_valid,
+        "checked_at": _IPFS_STATUS["checked_at"],
+        "max_file_size_mb": settings.MAX_FILE_SIZE / (1024*1024),
+        "status": "error" if error else ("operational" if credentials_valid else "unavailable")
+    }
+    if error:
+        result["error"] = error
+    
+    return result
+
+
+@router.get("/gateways")
+async def get_ipfs_gateways(
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    """Get available IPFS gateways"""
+    
+    gateways = [
+        {
+            "name": "Pinata Gateway",
+            "url": "https://gateway.pinata.cloud",
+            "primary": True
+        },
+        {
+            "name": "IPFS.io Gateway",
+            "url": "https://ipfs.io",
+            "primary": False
+        },
+        {
+            "name": "Cloudflare IPFS",
+            "url": "https://cloudflare-ipfs.com",
+            "primary": False
+        },
+        {
+            "name": "dweb.link",
+            "url": "https://dweb.link",
+            "primary": False
+        }
+    ]
+    
+    return {
+        "gateways": gateways,
+        "primary_gateway": "https://gateway.pinata.cloud"
+    }
 
 
 @router.get("/{hash}")
 async def get_from_ipfs(
     hash: str,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    download: bool = False,
+    current_user: User = Depends(get_current_active_user)
 ) -> Any:
-    """Get file information from IPFS"""
+    """Get file information from IPFS, or stream its content with ?download=true"""
+    _validate_cid(hash)
+    
+    if download:
+        return await stream_from_gateway(f"https://gateway.pinata.cloud/ipfs/{hash}")
     
     try:
-        import requests
-        
         # Try to fetch file metadata from IPFS
         ipfs_url = f"https://gateway.pinata.cloud/ipfs/{hash}"
-        response = requests.head(ipfs_url, timeout=10)
+        status_code, content_type, content_length = await _get_ipfs_metadata(hash, ipfs_url)
         
-        if response.status_code == 200:
+        if status_code == 200:
             file_info = {
                 "ipfs_hash": hash,
                 "ipfs_url": ipfs_url,
-                "content_type": response.headers.get("content-type", "unknown"),
-                "content_length": response.headers.get("content-length", "unknown"),
+                "content_type": content_type,
+                "content_length": content_length,
                 "accessible": True
             }
         else:
@@ -110,7 +285,7 @@ async def get_from_ipfs(
                 "ipfs_hash": hash,
                 "ipfs_url": ipfs_url,
                 "accessible": False,
-                "error": f"HTTP {response.status_code}"
+                "error": f"HTTP {status_code}"
             }
         
         return file_info
@@ -127,18 +302,16 @@ async def get_from_ipfs(
 @router.delete("/{hash}")
 async def delete_from_ipfs(
     hash: str,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """Delete a file from IPFS (Pinata unpin)"""
+    _validate_cid(hash)
     
     # Check if IPFS credentials are configured
     if not settings.IPFS_API_KEY or not settings.IPFS_API_SECRET:
         raise HTTPException(status_code=400, detail="IPFS credentials not configured")
     
     try:
-        import requests
-        
         # Unpin from Pinata
         url = "https://api.pinata.cloud/pinning/unpin"
         headers = {
@@ -147,7 +320,7 @@ async def delete_from_ipfs(
         }
         data = {"hashToUnpin": hash}
         
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+        response = await get_http_client().post(url, headers=headers, json=data, timeout=30)
         
         if response.status_code == 200:
             return {
@@ -168,8 +341,7 @@ async def delete_from_ipfs(
 async def upload_multiple_to_ipfs(
     files: List[UploadFile] = File(...),
     metadata: str = Form(None),
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """Upload multiple files to IPFS"""
     
@@ -178,29 +350,18 @@ async def upload_multiple_to_ipfs(
         raise HTTPException(status_code=400, detail="IPFS credentials not configured")
     
     try:
-        # Import IPFS upload function from agent
-        import sys
-        sys.path.append('../agent')
-        from ipfs_upload import upload_to_ipfs
-        
         results = []
-        temp_files = []
         
         for file in files:
+            # Create temporary file
+            temp_file_path = f"temp_{file.filename}"
             try:
-                # Create temporary file
-                temp_file_path = f"temp_{file.filename}"
-                temp_files.append(temp_file_path)
-                
-                with open(temp_file_path, "wb") as buffer:
-                    shutil.copyfileobj(file.file, buffer)
+                async with aiofiles.open(temp_file_path, "wb") as buffer:
+                    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                        await buffer.write(chunk)
                 
                 # Upload to IPFS
-                ipfs_hash = upload_to_ipfs(
-                    temp_file_path, 
-                    settings.IPFS_API_KEY, 
-                    settings.IPFS_API_SECRET
-                )
+                ipfs_hash = await pin_file(temp_file_path)
                 
                 results.append({
                     "filename": file.filename,
@@ -216,11 +377,9 @@ async def upload_multiple_to_ipfs(
                     "status": "failed",
                     "error": str(e)
                 })
-        
-        # Clean up temporary files
-        for temp_file in temp_files:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            finally:
+                # Clean up temporary file
+                Path(temp_file_path).unlink(missing_ok=True)
         
         # Parse metadata if provided
         parsed_metadata = None
@@ -237,66 +396,13 @@ async def upload_multiple_to_ipfs(
         }
         
     except Exception as e:
-        # Clean up temporary files
-        for temp_file in temp_files:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
         raise HTTPException(status_code=500, detail=f"IPFS upload failed: {str(e)}")
 
 
-@router.get("/status")
-async def get_ipfs_status(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
-) -> Any:
-    """Get IPFS service status and configuration"""
-    
-    # Check if IPFS credentials are configured
-    credentials_configured = bool(settings.IPFS_API_KEY and settings.IPFS_API_SECRET)
-    
-    try:
-        import requests
-        
-        # Test Pinata credentials
-        if credentials_configured:
-            url = "https://api.pinata.cloud/data/testAuthentication"
-            headers = {
-                "pinata_api_key": settings.IPFS_API_KEY,
-                "pinata_secret_api_key": settings.IPFS_API_SECRET
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            credentials_valid = response.status_code == 200
-        else:
-            credentials_valid = False
-        
-        return {
-            "service": "Pinata IPFS",
-            "api_url": settings.IPFS_API_URL,
-            "gateway_url": "https://gateway.pinata.cloud",
-            "credentials_configured": credentials_configured,
-            "credentials_valid": credentials_valid,
-            "max_file_size_mb": settings.MAX_FILE_SIZE / (1024*1024),
-            "status": "operational" if credentials_valid else "unavailable"
-        }
-        
-    except Exception as e:
-        return {
-            "service": "Pinata IPFS",
-            "api_url": settings.IPFS_API_URL,
-            "gateway_url": "https://gateway.pinata.cloud",
-            "credentials_configured": credentials_configured,
-            "credentials_valid": False,
-            "max_file_size_mb": settings.MAX_FILE_SIZE / (1024*1024),
-            "status": "error",
-            "error": str(e)
-        }
-
-
 @router.post("/upload-directory")
 async def upload_directory_to_ipfs(
     directory_data: dict,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """Upload a directory structure to IPFS (simulated)"""
     
@@ -318,39 +424,3 @@ async def upload_directory_to_ipfs(
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Directory upload failed: {str(e)}")
-
-
-@router.get("/gateways")
-async def get_ipfs_gateways(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
-) -> Any:
-    """Get available IPFS gateways"""
-    
-    gateways = [
-        {
-            "name": "Pinata Gateway",
-            "url": "https://gateway.pinata.cloud",
-            "primary": True
-        },
-        {
-            "name": "IPFS.io Gateway",
-            "url": "https://ipfs.io",
-            "primary": False
-        },
-        {
-            "name": "Cloudflare IPFS",
-            "url": "https://cloudflare-ipfs.com",
-            "primary": False
-        },
-        {
-            "name": "dweb.link",
-            "url": "https://dweb.link",
-            "primary": False
-        }
-    ]
-    
-    return {
-        "gateways": gateways,
-        "primary_gateway": "https://gateway.pinata.cloud"
-    } 
\ No newline at end of file
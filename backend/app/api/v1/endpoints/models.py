@@ -2,61 +2,116 @@
 Model endpoints for Aztec Protocol Backend
 """
 
-import json
+import logging
 import os
-import shutil
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import List, Any, Optional
 
-from app.core.database import get_db
+import aiofiles
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi.responses import FileResponse
+from sqlalchemy import select, insert, update, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import database
+from app.core.database import get_async_db, get_async_ro_db
 from app.core.security import get_current_active_user
+from app.core.clock import now_iso
 from app.models.user import User
 from app.models.model import Model
 from app.schemas.model import ModelCreate, ModelUpdate, ModelResponse, TrainingStats, ModelUpload
 from app.core.config import settings
+from app.core.pinata import pin_file
+from app.api.v1.endpoints.ipfs import stream_from_gateway
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Settings read on every request, bound once at import
+_UPLOAD_DIR = settings.UPLOAD_DIR
+_IPFS_KEY = settings.IPFS_API_KEY
+_IPFS_SECRET = settings.IPFS_API_SECRET
+
+# Chunk size for streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+# Accepted model upload extensions
+_ALLOWED_EXT_ORDER = (".pt", ".pth", ".bin", ".safetensors", ".json")
+_ALLOWED_EXT = frozenset(_ALLOWED_EXT_ORDER)
+_INVALID_EXT_DETAIL = f"Invalid file type. Allowed: {', '.join(_ALLOWED_EXT_ORDER)}"
+
+# Owner-scoped lookup by id, built once and reused by every handler
+_MODEL_BY_ID_AND_USER = select(Model).where(
+    Model.id == bindparam("model_id"),
+    Model.user_id == bindparam("user_id")
+)
+
+# 404 for owner-scoped lookups that miss. A fresh exception per raise: re-raising one
+# shared instance keeps growing its traceback and pins every failed request's frames
+def _model_not_found() -> HTTPException:
+    return HTTPException(status_code=404, detail="Model not found")
+
+# Listing projects only the ModelResponse columns (plain rows, no ORM identity map)
+_LIST_MODELS = select(
+    Model.id,
+    Model.name,
+    Model.description,
+    Model.model_type,
+    Model.architecture,
+    Model.parameters,
+    Model.file_size,
+    Model.ipfs_hash,
+    Model.accuracy,
+    Model.loss,
+    Model.status,
+    Model.training_config,
+    Model.created_at,
+    Model.updated_at
+).where(Model.user_id == bindparam("user_id")).order_by(Model.id)
+
 
 @router.get("/", response_model=List[ModelResponse])
 async def list_models(
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """List all models for the current user"""
-    models = db.query(Model).filter(
-        Model.user_id == current_user.id
-    ).offset(skip).limit(limit).all()
-    return models
+    query = _LIST_MODELS
+    if after_id is not None:
+        # Keyset page: seek past the last id seen instead of counting skipped rows
+        query = query.where(Model.id > after_id)
+    result = await db.execute(query.offset(skip).limit(limit), {"user_id": current_user.id})
+    return result.all()
 
 
 @router.post("/", response_model=ModelResponse)
 async def create_model(
     model: ModelCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Create a new model"""
-    db_model = Model(
-        name=model.name,
-        description=model.description,
-        model_type=model.model_type,
-        architecture=model.architecture,
-        parameters=model.parameters,
-        file_size=model.file_size,
-        ipfs_hash=model.ipfs_hash,
-        accuracy=model.accuracy,
-        loss=model.loss,
-        training_config=json.dumps(model.training_config) if model.training_config else None,
-        user_id=current_user.id
+    result = await db.execute(
+        insert(Model).values(
+            name=model.name,
+            description=model.description,
+            model_type=model.model_type,
+            architecture=model.architecture,
+            parameters=model.parameters,
+            file_size=model.file_size,
+            ipfs_hash=model.ipfs_hash,
+            accuracy=model.accuracy,
+            loss=model.loss,
+            training_config=model.training_config,
+            user_id=current_user.id
+        ).returning(Model)
     )
-    db.add(db_model)
-    db.commit()
-    db.refresh(db_model)
+    db_model = result.scalar_one()
+    await db.commit()
     return db_model
 
 
@@ -64,14 +119,13 @@ async def create_model(
 async def get_model(
     model_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """Get a specific model"""
-    model = db.query(Model).filter(
-        and_(Model.id == model_id, Model.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_MODEL_BY_ID_AND_USER, {"model_id": model_id, "user_id": current_user.id})
+    model = result.scalar_one_or_none()
     if not model:
-        raise HTTPException(status_code=404, detail="Model not found")
+        raise _model_not_found()
     return model
 
 
@@ -80,24 +134,25 @@ async def update_model(
     model_id: int,
     model_update: ModelUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Update a model"""
-    db_model = db.query(Model).filter(
-        and_(Model.id == model_id, Model.user_id == current_user.id)
-    ).first()
+    update_data = model_update.model_dump(exclude_unset=True)
+    if update_data:
+        # Apply the patch and read the row back in one UPDATE ... RETURNING
+        result = await db.execute(
+            update(Model)
+            .where(Model.id == model_id, Model.user_id == current_user.id)
+            .values(**update_data)
+            .returning(Model)
+        )
+    else:
+        result = await db.execute(_MODEL_BY_ID_AND_USER, {"model_id": model_id, "user_id": current_user.id})
+    db_model = result.scalar_one_or_none()
     if not db_model:
-        raise HTTPException(status_code=404, detail="Model not found")
-    
-    update_data = model_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        if field == "training_config" and value:
-            setattr(db_model, field, json.dumps(value))
-        else:
-            setattr(db_model, field, value)
+        raise _model_not_found()
     
-    db.commit()
-    db.refresh(db_model)
+    await db.commit()
     return db_model
 
 
@@ -105,17 +160,16 @@ async def update_model(
 async def delete_model(
     model_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Delete a model"""
-    db_model = db.query(Model).filter(
-        and_(Model.id == model_id, Model.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_MODEL_BY_ID_AND_USER, {"model_id": model_id, "user_id": current_user.id})
+    db_model = result.scalar_one_or_none()
     if not db_model:
-        raise HTTPException(status_code=404, detail="Model not found")
+        raise _model_not_found()
     
-    db.delete(db_model)
-    db.commit()
+    await db.delete(db_model)
+    await db.commit()
     return {"message": "Model deleted successfully"}
 
 
@@ -128,55 +182,53 @@ async def upload_model(
     model_file: UploadFile = File(...),
     training_stats_file: UploadFile = File(None),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Upload a model file with optional training stats"""
     
     # Validate file type
-    allowed_extensions = ['.pt', '.pth', '.bin', '.safetensors', '.json']
     file_ext = os.path.splitext(model_file.filename)[1].lower()
-    if file_ext not in allowed_extensions:
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
-        )
+    if file_ext not in _ALLOWED_EXT:
+        raise HTTPException(status_code=400, detail=_INVALID_EXT_DETAIL)
     
     # Create upload directory
-    upload_dir = os.path.join(settings.UPLOAD_DIR, str(current_user.id))
+    upload_dir = os.path.join(_UPLOAD_DIR, str(current_user.id))
     os.makedirs(upload_dir, exist_ok=True)
     
-    # Save model file
+    # Save model file in chunks without blocking the event loop
     file_path = os.path.join(upload_dir, model_file.filename)
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(model_file.file, buffer)
-    
-    # Get file size
-    file_size = os.path.getsize(file_path)
+    file_size = 0
+    async with aiofiles.open(file_path, "wb") as buffer:
+        while chunk := await model_file.read(UPLOAD_CHUNK_SIZE):
+            await buffer.write(chunk)
+            file_size += len(chunk)
     
     # Process training stats if provided
     training_config = None
     if training_stats_file:
         try:
             stats_content = await training_stats_file.read()
-            training_stats = json.loads(stats_content.decode())
+            training_stats = orjson.loads(stats_content)
             training_config = training_stats
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Invalid training stats file: {str(e)}")
     
     # Create model record
-    db_model = Model(
-        name=name,
-        description=description,
-        model_type=model_type,
-        architecture=architecture,
-        file_size=file_size,
-        training_config=json.dumps(training_config) if training_config else None,
-        status="uploaded",
-        user_id=current_user.id
+    result = await db.execute(
+        insert(Model).values(
+            name=name,
+            description=description,
+            model_type=model_type,
+            architecture=architecture,
+            file_size=file_size,
+            file_path=file_path,
+            training_config=training_config,
+            status="uploaded",
+            user_id=current_user.id
+        ).returning(Model)
     )
-    db.add(db_model)
-    db.commit()
-    db.refresh(db_model)
+    db_model = result.scalar_one()
+    await db.commit()
     
     return {
         "message": "Model uploaded successfully",
@@ -187,83 +239,96 @@ async def upload_model(
     }
 
 
-@router.post("/{model_id}/upload-to-ipfs")
+async def _push_model_to_ipfs(model_id: int, model_file_path: str):
+    """Upload a model file to Pinata and record the result (background task)"""
+    try:
+        ipfs_hash = await pin_file(model_file_path)
+        values = {"ipfs_hash": ipfs_hash, "status": "ready"}
+        logger.info(f"Model {model_id} uploaded to IPFS: {ipfs_hash}")
+    except Exception as e:
+        values = {"status": "error"}
+        logger.error(f"IPFS upload failed for model {model_id}: {e}")
+    
+    async with database.AsyncSessionLocal() as db:
+        await db.execute(update(Model).where(Model.id == model_id).values(**values))
+        await db.commit()
+
+
+@router.post("/{model_id}/upload-to-ipfs", status_code=202)
 async def upload_model_to_ipfs(
     model_id: int,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
-    """Upload model to IPFS using Pinata"""
-    db_model = db.query(Model).filter(
-        and_(Model.id == model_id, Model.user_id == current_user.id)
-    ).first()
+    """Queue a model upload to IPFS using Pinata"""
+    result = await db.execute(_MODEL_BY_ID_AND_USER, {"model_id": model_id, "user_id": current_user.id})
+    db_model = result.scalar_one_or_none()
     if not db_model:
-        raise HTTPException(status_code=404, detail="Model not found")
+        raise _model_not_found()
     
     # Check if IPFS credentials are configured
-    if not settings.IPFS_API_KEY or not settings.IPFS_API_SECRET:
+    if not _IPFS_KEY or not _IPFS_SECRET:
         raise HTTPException(status_code=400, detail="IPFS credentials not configured")
     
-    try:
-        # Import IPFS upload function from agent
-        import sys
-        sys.path.append('../agent')
-        from ipfs_upload import upload_to_ipfs
-        
-        # Find model file
-        upload_dir = os.path.join(settings.UPLOAD_DIR, str(current_user.id))
-        model_files = [f for f in os.listdir(upload_dir) if f.endswith(('.pt', '.pth', '.bin', '.safetensors'))]
-        
-        if not model_files:
-            raise HTTPException(status_code=404, detail="No model files found")
-        
-        model_file_path = os.path.join(upload_dir, model_files[0])
-        
-        # Upload to IPFS
-        ipfs_hash = upload_to_ipfs(
-            model_file_path, 
-            settings.IPFS_API_KEY, 
-            settings.IPFS_API_SECRET
-        )
-        
-        # Update model with IPFS hash
-        db_model.ipfs_hash = ipfs_hash
-        db_model.status = "ready"
-        db.commit()
-        
-        return {
-            "message": "Model uploaded to IPFS successfully",
-            "model_id": model_id,
-            "ipfs_hash": ipfs_hash,
-            "ipfs_url": f"https://gateway.pinata.cloud/ipfs/{ipfs_hash}"
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"IPFS upload failed: {str(e)}")
+    if db_model.status == "uploading":
+        raise HTTPException(status_code=409, detail="IPFS upload already in progress")
+    
+    # Model file location is recorded at upload time
+    model_file_path = db_model.file_path
+    if not model_file_path:
+        raise HTTPException(status_code=404, detail="No model files found")
+    
+    # Mark as uploading and hand the transfer to a background task
+    db_model.status = "uploading"
+    await db.commit()
+    background_tasks.add_task(_push_model_to_ipfs, model_id, model_file_path)
+    
+    return {
+        "message": "Model upload to IPFS started",
+        "model_id": model_id,
+        "status": "uploading",
+        "status_url": f"/api/v1/models/{model_id}/ipfs-status"
+    }
+
+
+@router.get("/{model_id}/ipfs-status")
+async def get_model_ipfs_status(
+    model_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_ro_db)
+) -> Any:
+    """Get the IPFS upload status of a model"""
+    result = await db.execute(_MODEL_BY_ID_AND_USER, {"model_id": model_id, "user_id": current_user.id})
+    db_model = result.scalar_one_or_none()
+    if not db_model:
+        raise _model_not_found()
+    
+    return {
+        "model_id": model_id,
+        "status": db_model.status,
+        "ipfs_hash": db_model.ipfs_hash,
+        "ipfs_url": f"https://gateway.pinata.cloud/ipfs/{db_model.ipfs_hash}" if db_model.ipfs_hash else None
+    }
 
 
 @router.get("/{model_id}/download")
 async def download_model(
     model_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """Get model download information"""
-    db_model = db.query(Model).filter(
-        and_(Model.id == model_id, Model.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_MODEL_BY_ID_AND_USER, {"model_id": model_id, "user_id": current_user.id})
+    db_model = result.scalar_one_or_none()
     if not db_model:
-        raise HTTPException(status_code=404, detail="Model not found")
+        raise _model_not_found()
     
-    # Find model file
-    upload_dir = os.path.join(settings.UPLOAD_DIR, str(current_user.id))
-    model_files = [f for f in os.listdir(upload_dir) if f.endswith(('.pt', '.pth', '.bin', '.safetensors'))]
-    
-    if not model_files:
+    # Model file location is recorded at upload time
+    model_file_path = db_model.file_path
+    if not model_file_path:
         raise HTTPException(status_code=404, detail="Model file not found")
     
-    model_file_path = os.path.join(upload_dir, model_files[0])
-    
     return {
         "model_id": model_id,
         "name": db_model.name,
@@ -271,24 +336,49 @@ async def download_model(
         "file_size": db_model.file_size,
         "ipfs_hash": db_model.ipfs_hash,
         "ipfs_url": f"https://gateway.pinata.cloud/ipfs/{db_model.ipfs_hash}" if db_model.ipfs_hash else None,
-        "training_config": json.loads(db_model.training_config) if db_model.training_config else None
+        "training_config": db_model.training_config
     }
 
 
+@router.get("/{model_id}/download-file")
+async def download_model_file(
+    model_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_ro_db)
+) -> Any:
+    """Download the model file (local copy, else proxied from IPFS)"""
+    result = await db.execute(_MODEL_BY_ID_AND_USER, {"model_id": model_id, "user_id": current_user.id})
+    db_model = result.scalar_one_or_none()
+    if not db_model:
+        raise _model_not_found()
+    
+    # FileResponse hands the file to the server's sendfile path when available
+    if db_model.file_path and os.path.isfile(db_model.file_path):
+        return FileResponse(
+            db_model.file_path,
+            media_type="application/octet-stream",
+            filename=os.path.basename(db_model.file_path)
+        )
+    
+    if db_model.ipfs_hash:
+        return await stream_from_gateway(f"https://gateway.pinata.cloud/ipfs/{db_model.ipfs_hash}")
+    
+    raise HTTPException(status_code=404, detail="Model file not found")
+
+
 @router.get("/{model_id}/training-stats")
 async def get_model_training_stats(
     model_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """Get model training statistics"""
-    db_model = db.query(Model).filter(
-        and_(Model.id == model_id, Model.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_MODEL_BY_ID_AND_USER, {"model_id": model_id, "user_id": current_user.id})
+    db_model = result.scalar_one_or_none()
     if not db_model:
-        raise HTTPException(status_code=404, detail="Model not found")
+        raise _model_not_found()
     
-    training_config = json.loads(db_model.training_config) if db_model.training_config else {}
+    training_config = db_model.training_config or {}
     
     return {
         "model_id": model_id,
@@ -306,14 +396,13 @@ async def evaluate_model(
     model_id: int,
     evaluation_data: dict,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Evaluate a model (simulated)"""
-    db_model = db.query(Model).filter(
-        and_(Model.id == model_id, Model.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_MODEL_BY_ID_AND_USER, {"model_id": model_id, "user_id": current_user.id})
+    db_model = result.scalar_one_or_none()
     if not db_model:
-        raise HTTPException(status_code=404, detail="Model not found")
+        raise _model_not_found()
     
     # Simulate model evaluation
     evaluation_result = {
@@ -324,12 +413,12 @@ async def evaluate_model(
         "recall": 0.83,
         "f1_score": 0.85,
         "evaluation_data": evaluation_data,
-        "timestamp": "2024-01-01T00:00:00Z"
+        "timestamp": now_iso()
     }
     
     # Update model with evaluation results
     db_model.accuracy = evaluation_result["accuracy"]
     db_model.loss = evaluation_result["loss"]
-    db.commit()
+    await db.commit()
     
     return evaluation_result 
\ No newline at end of file
@@ -2,72 +2,179 @@
 Proof endpoints for Aztec Protocol Backend
 """
 
-import json
-import os
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-
-from app.core.database import get_db
+import hashlib
+import logging
+from typing import Dict, List, Any, Optional
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File
+from sqlalchemy import select, insert, update, delete, bindparam
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from app.core import database
+from app.core.database import get_async_db, get_async_ro_db
 from app.core.security import get_current_active_user
+from app.core.clock import now_iso
 from app.models.user import User
-from app.models.proof import Proof
+from app.models.proof import Proof, ProofBlob
 from app.schemas.proof import ProofCreate, ProofUpdate, ProofResponse, ZKProofData, ProofVerification, TrainingData
 from app.core.config import settings
+from app.core.agent import zk_proof_system
+from app.core.pinata import pin_bytes
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Settings read on every request, bound once at import
+_IPFS_KEY = settings.IPFS_API_KEY
+_IPFS_SECRET = settings.IPFS_API_SECRET
+_MAX_FILE_SIZE = settings.MAX_FILE_SIZE
+_CONTRACT_ADDRESSES = settings.CONTRACT_ADDRESSES
+
+# Chunk size for reading uploaded proof files
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+# Dict-valued fields stored as JSON text
+_JSON_FIELDS = frozenset({"training_data", "zk_proofs", "verification_result"})
+
+# Owner-scoped lookup by id, built once and reused by every handler
+_PROOF_BY_ID_AND_USER = select(Proof).where(
+    Proof.id == bindparam("proof_id"),
+    Proof.user_id == bindparam("user_id")
+)
+
+# Static part of the fallback proof returned when the ZK toolchain is unavailable
+_SIMULATED_PROOF_TEMPLATE = {
+    "proof_type": "simulated",
+    "zk_proofs": {
+        "training_proof": "simulated_training_proof_hash",
+        "data_integrity_proof": "simulated_data_integrity_proof_hash",
+        "model_diff_proof": "simulated_model_diff_proof_hash"
+    },
+    "metadata": {
+        "model_diff": "model_diff.pt",
+        "note": "Simulated proofs generated"
+    },
+    "environment": "windows",
+    "capabilities": {
+        "zk_proofs_enabled": False,
+        "fallback_mode": True
+    }
+}
+
+# Same lookup with the deferred proof_data payload loaded, for handlers that return it
+_PROOF_WITH_DATA_BY_ID_AND_USER = _PROOF_BY_ID_AND_USER.options(undefer(Proof.proof_data))
+
+# 404 for owner-scoped lookups that miss. A fresh exception per raise: re-raising one
+# shared instance keeps growing its traceback and pins every failed request's frames
+def _proof_not_found() -> HTTPException:
+    return HTTPException(status_code=404, detail="Proof not found")
+
+
+async def _insert_proof(
+    db: AsyncSession, user_id: int, proof_type: str, proof_data: Dict[str, Any],
+    verification_status: str = "pending", ipfs_hash: Optional[str] = None
+):
+    """Store a proof payload in proofs.proof_data, keyed by its content hash; 409 on a duplicate"""
+    proof_hash = hashlib.sha256(orjson.dumps(proof_data, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    try:
+        result = await db.execute(
+            insert(Proof).values(
+                proof_type=proof_type,
+                proof_hash=proof_hash,
+                proof_data=proof_data,
+                verification_status=verification_status,
+                ipfs_hash=ipfs_hash,
+                user_id=user_id
+            ).returning(Proof.id, Proof.created_at, Proof.updated_at)
+        )
+        row = result.one()
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Proof already exists")
+    return row
+
+
+def _proof_response(proof_id: int, proof_type: str, status: str, proof_data: Optional[Dict[str, Any]],
+                    ipfs_hash: Optional[str], verification_result: Optional[bool],
+                    created_at, updated_at) -> Dict[str, Any]:
+    """ProofResponse fields, with description/training_data/zk_proofs read from the proof_data payload"""
+    data = proof_data or {}
+    return {
+        "id": proof_id,
+        "proof_type": proof_type,
+        "description": data.get("description"),
+        "status": status or "pending",
+        "training_data": data.get("training_data"),
+        "zk_proofs": data.get("zk_proofs"),
+        "ipfs_hash": ipfs_hash,
+        "verification_result": None if verification_result is None else {"result": verification_result},
+        "created_at": created_at,
+        "updated_at": updated_at
+    }
+
+
+def _db_proof_response(db_proof: Proof) -> Dict[str, Any]:
+    return _proof_response(
+        db_proof.id, db_proof.proof_type, db_proof.verification_status, db_proof.proof_data,
+        db_proof.ipfs_hash, db_proof.verification_result, db_proof.created_at, db_proof.updated_at
+    )
+
 
 @router.get("/", response_model=List[ProofResponse])
 async def list_proofs(
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """List all proofs for the current user"""
-    proofs = db.query(Proof).filter(
-        Proof.user_id == current_user.id
-    ).offset(skip).limit(limit).all()
-    return proofs
+    query = select(Proof).options(undefer(Proof.proof_data)).where(Proof.user_id == current_user.id)
+    if after_id is not None:
+        # Keyset page: seek past the last id seen instead of counting skipped rows
+        query = query.where(Proof.id > after_id)
+    result = await db.execute(query.order_by(Proof.id).offset(skip).limit(limit))
+    return [_db_proof_response(db_proof) for db_proof in result.scalars()]
 
 
 @router.post("/", response_model=ProofResponse)
 async def create_proof(
     proof: ProofCreate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Create a new proof"""
-    db_proof = Proof(
-        proof_type=proof.proof_type,
-        description=proof.description,
-        status=proof.status,
-        training_data=json.dumps(proof.training_data) if proof.training_data else None,
-        zk_proofs=json.dumps(proof.zk_proofs) if proof.zk_proofs else None,
-        ipfs_hash=proof.ipfs_hash,
-        user_id=current_user.id
+    proof_data = {
+        "description": proof.description,
+        "training_data": proof.training_data,
+        "zk_proofs": proof.zk_proofs
+    }
+    row = await _insert_proof(
+        db, current_user.id, proof.proof_type, proof_data,
+        verification_status=proof.status, ipfs_hash=proof.ipfs_hash
+    )
+    return _proof_response(
+        row.id, proof.proof_type, proof.status, proof_data, proof.ipfs_hash, None, row.created_at, row.updated_at
     )
-    db.add(db_proof)
-    db.commit()
-    db.refresh(db_proof)
-    return db_proof
 
 
 @router.get("/{proof_id}", response_model=ProofResponse)
 async def get_proof(
     proof_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """Get a specific proof"""
-    proof = db.query(Proof).filter(
-        and_(Proof.id == proof_id, Proof.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_PROOF_WITH_DATA_BY_ID_AND_USER, {"proof_id": proof_id, "user_id": current_user.id})
+    proof = result.scalar_one_or_none()
     if not proof:
-        raise HTTPException(status_code=404, detail="Proof not found")
-    return proof
+        raise _proof_not_found()
+    return _db_proof_response(proof)
 
 
 @router.put("/{proof_id}", response_model=ProofResponse)
@@ -75,24 +182,29 @@ async def update_proof(
     proof_id: int,
     proof_update: ProofUpdate,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Update a proof"""
-    db_proof = db.query(Proof).filter(
-        and_(Proof.id == proof_id, Proof.user_id == current_user.id)
-    ).first()
-    if not db_proof:
-        raise HTTPException(status_code=404, detail="Proof not found")
+    update_data = proof_update.model_dump(exclude_unset=True)
+    for field in _JSON_FIELDS & update_data.keys():
+        if update_data[field]:
+            update_data[field] = orjson.dumps(update_data[field]).decode()
     
-    update_data = proof_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        if field in ["training_data", "zk_proofs", "verification_result"] and value:
-            setattr(db_proof, field, json.dumps(value))
-        else:
-            setattr(db_proof, field, value)
+    if update_data:
+        # Apply the patch and read the row back in one UPDATE ... RETURNING
+        result = await db.execute(
+            update(Proof)
+            .where(Proof.id == proof_id, Proof.user_id == current_user.id)
+            .values(**update_data)
+            .returning(Proof)
+        )
+    else:
+        result = await db.execute(_PROOF_BY_ID_AND_USER, {"proof_id": proof_id, "user_id": current_user.id})
+    db_proof = result.scalar_one_or_none()
+    if not db_proof:
+        raise _proof_not_found()
     
-    db.commit()
-    db.refresh(db_proof)
+    await db.commit()
     return db_proof
 
 
@@ -100,17 +212,18 @@ async def update_proof(
 async def delete_proof(
     proof_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Delete a proof"""
-    db_proof = db.query(Proof).filter(
-        and_(Proof.id == proof_id, Proof.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_PROOF_BY_ID_AND_USER, {"proof_id": proof_id, "user_id": current_user.id})
+    db_proof = result.scalar_one_or_none()
     if not db_proof:
-        raise HTTPException(status_code=404, detail="Proof not found")
+        raise _proof_not_found()
     
-    db.delete(db_proof)
-    db.commit()
+    # SQLite does not enforce the blob's ON DELETE CASCADE, so remove it explicitly
+    await db.execute(delete(ProofBlob).where(ProofBlob.proof_id == proof_id))
+    await db.delete(db_proof)
+    await db.commit()
     return {"message": "Proof deleted successfully"}
 
 
@@ -119,32 +232,24 @@ async def generate_proof(
     training_data: TrainingData,
     proof_type: str = "zk_proofs",
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Generate a new proof from training data"""
     
+    training_payload = training_data.model_dump()
+    ZKProofSystem = zk_proof_system()
+    
     try:
-        # Import ZK proof system from agent
-        import sys
-        sys.path.append('../agent')
-        
-        # Try to import ZK proof system
-        try:
-            from zk_proofs import ZKProofSystem
-            zk_available = True
-        except ImportError:
-            zk_available = False
-        
-        if zk_available and proof_type == "zk_proofs":
+        if ZKProofSystem is not None and proof_type == "zk_proofs":
             # Generate real ZK proofs
             zk_system = ZKProofSystem()
-            zk_proofs = zk_system.generate_all_proofs(training_data.dict())
+            zk_proofs = zk_system.generate_all_proofs(training_payload)
             
             proof_data = {
                 "proof_type": "zk_proofs",
-                "timestamp": "2024-01-01T00:00:00Z",
+                "timestamp": now_iso(),
                 "zk_proofs": zk_proofs,
-                "training_data": training_data.dict(),
+                "training_data": training_payload,
                 "metadata": {
                     "model_diff": "model_diff.pt",
                     "note": "ZK proofs generated successfully"
@@ -158,46 +263,27 @@ async def generate_proof(
         else:
             # Generate simulated proofs
             proof_data = {
-                "proof_type": "simulated",
-                "timestamp": "2024-01-01T00:00:00Z",
-                "zk_proofs": {
-                    "training_proof": "simulated_training_proof_hash",
-                    "data_integrity_proof": "simulated_data_integrity_proof_hash",
-                    "model_diff_proof": "simulated_model_diff_proof_hash"
-                },
-                "training_data": training_data.dict(),
-                "metadata": {
-                    "model_diff": "model_diff.pt",
-                    "note": "Simulated proofs generated"
-                },
-                "environment": "windows",
-                "capabilities": {
-                    "zk_proofs_enabled": False,
-                    "fallback_mode": True
-                }
+                **_SIMULATED_PROOF_TEMPLATE,
+                "timestamp": now_iso(),
+                "training_data": training_payload
             }
         
         # Create proof record
-        db_proof = Proof(
-            proof_type=proof_type,
-            description=f"Generated {proof_type} for training data",
-            status="pending",
-            training_data=json.dumps(training_data.dict()),
-            zk_proofs=json.dumps(proof_data),
-            user_id=current_user.id
+        row = await _insert_proof(
+            db, current_user.id, proof_type,
+            {**proof_data, "description": f"Generated {proof_type} for training data"}
         )
-        db.add(db_proof)
-        db.commit()
-        db.refresh(db_proof)
         
         return {
             "message": f"Proof generated successfully",
-            "proof_id": db_proof.id,
+            "proof_id": row.id,
             "proof_type": proof_type,
             "proof_data": proof_data,
-            "zk_available": zk_available
+            "zk_available": ZKProofSystem is not None
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Proof generation failed: {str(e)}")
 
@@ -207,14 +293,13 @@ async def verify_proof(
     proof_id: int,
     verification: ProofVerification,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Verify a proof"""
-    db_proof = db.query(Proof).filter(
-        and_(Proof.id == proof_id, Proof.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_PROOF_BY_ID_AND_USER, {"proof_id": proof_id, "user_id": current_user.id})
+    db_proof = result.scalar_one_or_none()
     if not db_proof:
-        raise HTTPException(status_code=404, detail="Proof not found")
+        raise _proof_not_found()
     
     try:
         # Simulate proof verification
@@ -222,14 +307,14 @@ async def verify_proof(
             "verification_type": verification.verification_type,
             "result": verification.result,
             "details": verification.details or {},
-            "timestamp": "2024-01-01T00:00:00Z",
+            "timestamp": now_iso(),
             "blockchain_submitted": verification.blockchain_submitted
         }
         
         # Update proof with verification result
-        db_proof.verification_result = json.dumps(verification_result)
+        db_proof.verification_result = orjson.dumps(verification_result).decode()
         db_proof.status = "verified" if verification.result else "failed"
-        db.commit()
+        await db.commit()
         
         return {
             "message": "Proof verification completed",
@@ -241,77 +326,101 @@ async def verify_proof(
         raise HTTPException(status_code=500, detail=f"Proof verification failed: {str(e)}")
 
 
-@router.post("/{proof_id}/upload")
+async def _push_proof_to_ipfs(proof_id: int, proof_payload: Dict[str, Any]):
+    """Upload a proof document to Pinata and record the result (background task)"""
+    try:
+        # Serialize straight into the multipart body; no temp file
+        ipfs_hash = await pin_bytes(
+            orjson.dumps(proof_payload, option=orjson.OPT_INDENT_2),
+            f"proof_{proof_id}.json",
+            "application/json"
+        )
+        
+        values = {"ipfs_hash": ipfs_hash, "ipfs_status": "ready"}
+        logger.info(f"Proof {proof_id} uploaded to IPFS: {ipfs_hash}")
+    except Exception as e:
+        values = {"ipfs_status": "error"}
+        logger.error(f"IPFS upload failed for proof {proof_id}: {e}")
+    
+    async with database.AsyncSessionLocal() as db:
+        await db.execute(update(Proof).where(Proof.id == proof_id).values(**values))
+        await db.commit()
+
+
+@router.post("/{proof_id}/upload", status_code=202)
 async def upload_proof_to_ipfs(
     proof_id: int,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
-    """Upload proof to IPFS"""
-    db_proof = db.query(Proof).filter(
-        and_(Proof.id == proof_id, Proof.user_id == current_user.id)
-    ).first()
+    """Queue a proof upload to IPFS"""
+    result = await db.execute(_PROOF_BY_ID_AND_USER, {"proof_id": proof_id, "user_id": current_user.id})
+    db_proof = result.scalar_one_or_none()
     if not db_proof:
-        raise HTTPException(status_code=404, detail="Proof not found")
+        raise _proof_not_found()
     
     # Check if IPFS credentials are configured
-    if not settings.IPFS_API_KEY or not settings.IPFS_API_SECRET:
+    if not _IPFS_KEY or not _IPFS_SECRET:
         raise HTTPException(status_code=400, detail="IPFS credentials not configured")
     
-    try:
-        # Import IPFS upload function from agent
-        import sys
-        sys.path.append('../agent')
-        from ipfs_upload import upload_to_ipfs
-        
-        # Create proof file
-        proof_file_path = f"proof_{proof_id}.json"
-        with open(proof_file_path, "w") as f:
-            json.dump({
-                "proof_id": proof_id,
-                "proof_type": db_proof.proof_type,
-                "training_data": json.loads(db_proof.training_data) if db_proof.training_data else {},
-                "zk_proofs": json.loads(db_proof.zk_proofs) if db_proof.zk_proofs else {},
-                "timestamp": "2024-01-01T00:00:00Z"
-            }, f, indent=2)
-        
-        # Upload to IPFS
-        ipfs_hash = upload_to_ipfs(
-            proof_file_path, 
-            settings.IPFS_API_KEY, 
-            settings.IPFS_API_SECRET
-        )
-        
-        # Update proof with IPFS hash
-        db_proof.ipfs_hash = ipfs_hash
-        db.commit()
-        
-        # Clean up temporary file
-        os.remove(proof_file_path)
-        
-        return {
-            "message": "Proof uploaded to IPFS successfully",
-            "proof_id": proof_id,
-            "ipfs_hash": ipfs_hash,
-            "ipfs_url": f"https://gateway.pinata.cloud/ipfs/{ipfs_hash}"
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"IPFS upload failed: {str(e)}")
+    if db_proof.ipfs_status == "uploading":
+        raise HTTPException(status_code=409, detail="IPFS upload already in progress")
+    
+    proof_payload = {
+        "proof_id": proof_id,
+        "proof_type": db_proof.proof_type,
+        "training_data": orjson.loads(db_proof.training_data) if db_proof.training_data else {},
+        "zk_proofs": orjson.loads(db_proof.zk_proofs) if db_proof.zk_proofs else {},
+        "timestamp": now_iso()
+    }
+    
+    # Mark as uploading and hand the transfer to a background task
+    db_proof.ipfs_status = "uploading"
+    await db.commit()
+    background_tasks.add_task(_push_proof_to_ipfs, proof_id, proof_payload)
+    
+    return {
+        "message": "Proof upload to IPFS started",
+        "proof_id": proof_id,
+        "status": "uploading",
+        "status_url": f"/api/v1/proofs/{proof_id}/ipfs-status"
+    }
+
+
+@router.get("/{proof_id}/ipfs-status")
+async def get_proof_ipfs_status(
+    proof_id: int,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_ro_db)
+) -> Any:
+    """Get the IPFS upload status of a proof"""
+    result = await db.execute(_PROOF_BY_ID_AND_USER, {"proof_id": proof_id, "user_id": current_user.id})
+    db_proof = result.scalar_one_or_none()
+    if not db_proof:
+        raise _proof_not_found()
+    
+    upload_status = db_proof.ipfs_status or ("ready" if db_proof.ipfs_hash else "not_uploaded")
+    
+    return {
+        "proof_id": proof_id,
+        "status": upload_status,
+        "ipfs_hash": db_proof.ipfs_hash,
+        "ipfs_url": f"https://gateway.pinata.cloud/ipfs/{db_proof.ipfs_hash}" if db_proof.ipfs_hash else None
+    }
 
 
 @router.post("/{proof_id}/submit-to-blockchain")
 async def submit_proof_to_blockchain(
     proof_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Submit proof to blockchain for verification"""
-    db_proof = db.query(Proof).filter(
-        and_(Proof.id == proof_id, Proof.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_PROOF_BY_ID_AND_USER, {"proof_id": proof_id, "user_id": current_user.id})
+    db_proof = result.scalar_one_or_none()
     if not db_proof:
-        raise HTTPException(status_code=404, detail="Proof not found")
+        raise _proof_not_found()
     
     try:
         # Simulate blockchain submission
@@ -319,13 +428,13 @@ async def submit_proof_to_blockchain(
         
         # Update proof with blockchain transaction hash
         db_proof.blockchain_tx_hash = tx_hash
-        db.commit()
+        await db.commit()
         
         return {
             "message": "Proof submitted to blockchain successfully",
             "proof_id": proof_id,
             "transaction_hash": tx_hash,
-            "contract_address": settings.CONTRACT_ADDRESSES.get("proof_verifier")
+            "contract_address": _CONTRACT_ADDRESSES.get("proof_verifier")
         }
         
     except Exception as e:
@@ -336,24 +445,23 @@ async def submit_proof_to_blockchain(
 async def download_proof(
     proof_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """Get proof download information"""
-    db_proof = db.query(Proof).filter(
-        and_(Proof.id == proof_id, Proof.user_id == current_user.id)
-    ).first()
+    result = await db.execute(_PROOF_BY_ID_AND_USER, {"proof_id": proof_id, "user_id": current_user.id})
+    db_proof = result.scalar_one_or_none()
     if not db_proof:
-        raise HTTPException(status_code=404, detail="Proof not found")
+        raise _proof_not_found()
     
     return {
         "proof_id": proof_id,
         "proof_type": db_proof.proof_type,
         "status": db_proof.status,
-        "training_data": json.loads(db_proof.training_data) if db_proof.training_data else {},
-        "zk_proofs": json.loads(db_proof.zk_proofs) if db_proof.zk_proofs else {},
+        "training_data": orjson.loads(db_proof.training_data) if db_proof.training_data else {},
+        "zk_proofs": orjson.loads(db_proof.zk_proofs) if db_proof.zk_proofs else {},
         "ipfs_hash": db_proof.ipfs_hash,
         "ipfs_url": f"https://gateway.pinata.cloud/ipfs/{db_proof.ipfs_hash}" if db_proof.ipfs_hash else None,
-        "verification_result": json.loads(db_proof.verification_result) if db_proof.verification_result else {},
+        "verification_result": orjson.loads(db_proof.verification_result) if db_proof.verification_result else {},
         "blockchain_tx_hash": db_proof.blockchain_tx_hash
     }
 
@@ -364,7 +472,7 @@ async def upload_proof_file(
     proof_type: str = "zk_proofs",
     description: str = None,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Upload a proof file"""
     
@@ -372,30 +480,34 @@ async def upload_proof_file(
     if not proof_file.filename.endswith('.json'):
         raise HTTPException(status_code=400, detail="Proof file must be a JSON file")
     
+    # Read proof file in chunks, rejecting anything over the upload limit
+    content = bytearray()
+    while chunk := await proof_file.read(UPLOAD_CHUNK_SIZE):
+        content += chunk
+        if len(content) > _MAX_FILE_SIZE:
+            raise HTTPException(status_code=413, detail="Proof file too large")
+    
+    # Parse proof file
     try:
-        # Read and parse proof file
-        content = await proof_file.read()
-        proof_data = json.loads(content.decode())
-        
-        # Create proof record
-        db_proof = Proof(
-            proof_type=proof_type,
-            description=description or f"Uploaded {proof_type}",
-            status="pending",
-            training_data=json.dumps(proof_data.get("training_data", {})),
-            zk_proofs=json.dumps(proof_data.get("zk_proofs", {})),
-            user_id=current_user.id
-        )
-        db.add(db_proof)
-        db.commit()
-        db.refresh(db_proof)
-        
-        return {
-            "message": "Proof file uploaded successfully",
-            "proof_id": db_proof.id,
-            "proof_type": proof_type,
-            "proof_data": proof_data
+        proof_data = orjson.loads(content)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Failed to parse proof file: {str(e)}")
+    if not isinstance(proof_data, dict):
+        raise HTTPException(status_code=400, detail="Failed to parse proof file: expected a JSON object")
+    
+    # Create proof record
+    row = await _insert_proof(
+        db, current_user.id, proof_type,
+        {
+            "description": description or f"Uploaded {proof_type}",
+            "training_data": proof_data.get("training_data", {}),
+            "zk_proofs": proof_data.get("zk_proofs", {})
         }
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Failed to parse proof file: {str(e)}") 
\ No newline at end of file
+    )
+    
+    return {
+        "message": "Proof file uploaded successfully",
+        "proof_id": row.id,
+        "proof_type": proof_type,
+        "proof_data": proof_data
+    } 
\ No newline at end of file
@@ -3,10 +3,10 @@ Rounds endpoints for Aztec Protocol Backend
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Any
 
-from app.core.database import get_db
+from app.core.database import get_async_db, get_async_ro_db
 from app.core.security import get_current_active_user
 from app.models.user import User
 
@@ -16,7 +16,7 @@ router = APIRouter()
 @router.get("/")
 async def list_rounds(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """List all collaboration rounds"""
     return {"message": "Rounds endpoint - coming soon"}
@@ -25,7 +25,7 @@ async def list_rounds(
 @router.post("/")
 async def create_round(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Create a new collaboration round"""
     return {"message": "Create round - coming soon"}
@@ -35,7 +35,7 @@ async def create_round(
 async def get_round(
     round_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> Any:
     """Get a specific round"""
     return {"message": f"Get round {round_id} - coming soon"}
@@ -45,7 +45,7 @@ async def get_round(
 async def update_round(
     round_id: int,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Any:
     """Update a round"""
     return {"message": f"Update round {round_id} - coming soon"} 
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+Agent package bindings for Aztec Protocol Backend
+"""
+
+import logging
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Make the agent package importable once, at module load
+AGENT_DIR = str(Path(__file__).resolve().parents[3] / "agent")
+if AGENT_DIR not in sys.path:
+    sys.path.insert(0, AGENT_DIR)
+
+
+@lru_cache(maxsize=None)
+def zk_proof_system():
+    """Import the agent's ZKProofSystem on first use; None when the toolchain is unavailable"""
+    # Imported lazily: zk_proofs calls logging.basicConfig at import time, which must not
+    # run before the application has configured logging
+    try:
+        from zk_proofs import ZKProofSystem
+    except ImportError:
+        logger.warning("ZK proof system not available; proofs will be simulated")
+        return None
+    return ZKProofSystem
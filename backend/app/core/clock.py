@@ -0,0 +1,29 @@
+"""
+Cached wall-clock timestamp for Aztec Protocol Backend
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+
+def _format_now() -> str:
+    """Format the current UTC time as ISO-8601 with a Z suffix"""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+# Current timestamp, refreshed once per second by run_clock()
+_NOW_ISO = _format_now()
+
+
+def now_iso() -> str:
+    """Get the cached current UTC timestamp (second resolution)"""
+    return _NOW_ISO
+
+
+async def run_clock():
+    """Refresh the cached timestamp every second"""
+    global _NOW_ISO
+    
+    while True:
+        _NOW_ISO = _format_now()
+        await asyncio.sleep(1)
@@ -3,6 +3,7 @@ Configuration settings for Aztec Protocol Backend
 """
 
 import os
+from functools import lru_cache
 from typing import List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import validator
@@ -17,15 +18,26 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    WORKERS: Optional[int] = None  # uvicorn worker processes when DEBUG is off; defaults to 1
+    BEHIND_PROXY: bool = False  # trust X-Forwarded-* headers from a reverse proxy
     
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    BCRYPT_ROUNDS: int = 12
     
     # Database
     DATABASE_URL: str = "sqlite:///./aztec.db"
     DATABASE_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_USE_LIFO: bool = True
+    DB_READ_POOL_SIZE: int = 8  # SQLite read-only connections
+    AUTO_CREATE_TABLES: Optional[bool] = None  # defaults to on for SQLite only; use Alembic elsewhere
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
@@ -33,6 +45,10 @@ class Settings(BaseSettings):
     # CORS
     ALLOWED_HOSTS: List[str] = ["*"]
     
+    # Response compression
+    GZIP_MINIMUM_SIZE: int = 1000
+    GZIP_COMPRESS_LEVEL: int = 5  # 1-9; most of level 9's ratio at a fraction of the CPU
+    
     # Blockchain
     ETHEREUM_RPC_URL: str = "http://localhost:8545"
     CONTRACT_ADDRESSES: dict = {
@@ -45,6 +61,13 @@ class Settings(BaseSettings):
     IPFS_API_URL: str = "https://gateway.pinata.cloud"
     IPFS_API_KEY: Optional[str] = None
     IPFS_API_SECRET: Optional[str] = None
+    IPFS_STATUS_REFRESH_SECONDS: int = 30
+    
+    # Outbound HTTP (shared connection pool for Pinata/IPFS)
+    HTTP_POOL_MAX: int = 128
+    HTTP_POOL_KEEPALIVE: int = 64
+    HTTP_RETRIES: int = 2
+    HTTP_TIMEOUT_SECONDS: float = 30.0
     
     # AI/ML
     MODEL_CACHE_DIR: str = "./models"
@@ -86,10 +109,34 @@ class Settings(BaseSettings):
             raise ValueError("DATABASE_URL cannot be empty")
         return v
     
+    @validator("DB_POOL_SIZE", "DB_READ_POOL_SIZE")
+    def validate_pool_size(cls, v):
+        """Validate connection pool size"""
+        if not 1 <= v <= 100:
+            raise ValueError("pool size must be between 1 and 100")
+        return v
+    
+    @validator("DB_MAX_OVERFLOW")
+    def validate_max_overflow(cls, v):
+        """Validate connection pool overflow"""
+        if not 0 <= v <= 100:
+            raise ValueError("DB_MAX_OVERFLOW must be between 0 and 100")
+        return v
+    
+    @validator("AUTO_CREATE_TABLES", always=True)
+    def validate_auto_create_tables(cls, v, values):
+        """Create tables at startup for local SQLite unless set explicitly"""
+        if v is None:
+            return values.get("DATABASE_URL", "").startswith("sqlite")
+        return v
+    
     @validator("SECRET_KEY")
-    def validate_secret_key(cls, v):
+    def validate_secret_key(cls, v, values):
         """Validate secret key"""
         if v == "your-secret-key-change-in-production":
+            # A generated key differs per process, so workers would reject each other's tokens
+            if not values.get("DEBUG") and (values.get("WORKERS") or 1) > 1:
+                raise ValueError("SECRET_KEY must be set explicitly when running more than one worker")
             import secrets
             return secrets.token_urlsafe(32)
         return v
@@ -97,7 +144,14 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         case_sensitive = True
+        frozen = True
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Get the application settings (loaded once)"""
+    return Settings()
 
 
 # Create settings instance
-settings = Settings() 
\ No newline at end of file
+settings = get_settings() 
\ No newline at end of file
@@ -2,9 +2,11 @@
 Database configuration and connection management
 """
 
+import asyncio
 import logging
 from typing import AsyncGenerator
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import JSON, create_engine, event, MetaData
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -16,72 +18,139 @@ logger = logging.getLogger(__name__)
 # Create declarative base
 Base = declarative_base()
 
+# JSON column type: binary JSONB on PostgreSQL, plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB, "postgresql")
+
 # Database engines
 engine = None
 async_engine = None
+async_ro_engine = None
 SessionLocal = None
 AsyncSessionLocal = None
+AsyncSessionLocalRO = None
 
 
-def init_db():
-    """Initialize database connection"""
-    global engine, async_engine, SessionLocal, AsyncSessionLocal
-    
-    try:
-        if settings.DATABASE_URL.startswith("sqlite"):
-            # SQLite configuration
-            engine = create_engine(
-                settings.DATABASE_URL,
-                connect_args={"check_same_thread": False},
-                poolclass=StaticPool,
-                echo=settings.DATABASE_ECHO
-            )
-            SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        else:
-            # PostgreSQL/MySQL configuration
-            engine = create_engine(
-                settings.DATABASE_URL,
-                echo=settings.DATABASE_ECHO,
-                pool_pre_ping=True
-            )
-            SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        
-        # Create tables
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database initialized successfully")
-        
-    except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
-        raise
+# Applied to every new SQLite connection: WAL lets readers run alongside the writer,
+# NORMAL sync skips the per-commit fsync WAL does not need, and cache/mmap stay in memory
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # 64MB
+    "PRAGMA mmap_size=268435456"  # 256MB
+)
+
+
+# Read-only connections inherit WAL from the file; they only tune their own caches
+_SQLITE_READ_PRAGMAS = _SQLITE_PRAGMAS[2:]
+
+
+def _run_pragmas(dbapi_connection, pragmas):
+    cursor = dbapi_connection.cursor()
+    for pragma in pragmas:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune a freshly opened SQLite connection"""
+    _run_pragmas(dbapi_connection, _SQLITE_PRAGMAS)
+
+
+def _set_sqlite_read_pragmas(dbapi_connection, connection_record):
+    """Tune a freshly opened read-only SQLite connection"""
+    _run_pragmas(dbapi_connection, _SQLITE_READ_PRAGMAS)
+
+
+def _pool_options() -> dict:
+    """Connection pool options for server databases"""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        # Reuse the most recent connection so surplus ones idle out and get recycled
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO
+    }
+
+
+async def _warm_pool(engine, size: int):
+    """Check out and return `size` connections so the pool starts full"""
+    connections = await asyncio.gather(*(engine.connect() for _ in range(size)))
+    await asyncio.gather(*(connection.close() for connection in connections))
+    logger.info(f"Database pool warmed with {size} connections")
+
+
+def _async_database_url(url: str) -> str:
+    """Map a sync database URL onto its async driver"""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql+asyncpg://", 1)
+    return url
+
+
+def _sqlite_read_only_url(url: str) -> str:
+    """Open the same SQLite file read-only through a URI filename"""
+    path = url.split(":///", 1)[1]
+    return f"sqlite+aiosqlite:///file:{path}?mode=ro&uri=true"
 
 
 async def init_async_db():
     """Initialize async database connection"""
-    global async_engine, AsyncSessionLocal
+    global async_engine, async_ro_engine, AsyncSessionLocal, AsyncSessionLocalRO
     
     try:
         if settings.DATABASE_URL.startswith("sqlite"):
-            # SQLite async configuration
+            # SQLite allows one writer: give it a single connection. An in-memory database
+            # lives in that connection, so it is held in a StaticPool and also serves reads
+            in_memory = ":memory:" in settings.DATABASE_URL
+            pool_options = {"poolclass": StaticPool} if in_memory else {"pool_size": 1, "max_overflow": 0}
             async_engine = create_async_engine(
                 settings.DATABASE_URL.replace("sqlite:///", "sqlite+aiosqlite:///"),
                 connect_args={"check_same_thread": False},
-                echo=settings.DATABASE_ECHO
+                echo=settings.DATABASE_ECHO,
+                **pool_options
             )
+            event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+            
+            # Readers get their own read-only pool and run alongside the writer under WAL
+            if in_memory:
+                async_ro_engine = async_engine
+            else:
+                async_ro_engine = create_async_engine(
+                    _sqlite_read_only_url(settings.DATABASE_URL),
+                    connect_args={"check_same_thread": False},
+                    pool_size=settings.DB_READ_POOL_SIZE,
+                    max_overflow=0,
+                    echo=settings.DATABASE_ECHO
+                )
+                event.listen(async_ro_engine.sync_engine, "connect", _set_sqlite_read_pragmas)
         else:
             # PostgreSQL/MySQL async configuration
             async_engine = create_async_engine(
-                settings.DATABASE_URL,
+                _async_database_url(settings.DATABASE_URL),
                 echo=settings.DATABASE_ECHO,
-                pool_pre_ping=True
+                **_pool_options()
             )
+            async_ro_engine = async_engine
         
         AsyncSessionLocal = async_sessionmaker(
             async_engine, class_=AsyncSession, expire_on_commit=False
         )
+        AsyncSessionLocalRO = async_sessionmaker(
+            async_ro_engine, class_=AsyncSession, expire_on_commit=False
+        )
         
-        # Create tables
-        async with async_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        # Local SQLite creates tables on the fly; other databases are migrated with Alembic
+        if settings.AUTO_CREATE_TABLES:
+            async with async_engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+        
+        # Open the pooled connections up front so first requests skip connection setup
+        if not settings.DATABASE_URL.startswith("sqlite"):
+            await _warm_pool(async_engine, settings.DB_POOL_SIZE)
         
         logger.info("Async database initialized successfully")
         
@@ -103,18 +172,19 @@ def init_db():
                 poolclass=StaticPool,
                 echo=settings.DATABASE_ECHO
             )
+            event.listen(engine, "connect", _set_sqlite_pragmas)
             SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
         else:
             # PostgreSQL/MySQL configuration
             engine = create_engine(
                 settings.DATABASE_URL,
                 echo=settings.DATABASE_ECHO,
-                pool_pre_ping=True
+                **_pool_options()
             )
             SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
         
-        # Create tables
-        Base.metadata.create_all(bind=engine)
+        if settings.AUTO_CREATE_TABLES:
+            Base.metadata.create_all(bind=engine)
         logger.info("Database initialized successfully")
         
     except Exception as e:
@@ -122,28 +192,25 @@ def init_db():
         raise
 
 
-def close_db():
+async def close_db():
     """Close database connections"""
-    global engine, async_engine
+    global engine, async_engine, async_ro_engine
     
     if engine:
         engine.dispose()
+        engine = None
         logger.info("Sync database connection closed")
     
+    if async_ro_engine is not None and async_ro_engine is not async_engine:
+        await async_ro_engine.dispose()
+    async_ro_engine = None
+    
     if async_engine:
-        async_engine.dispose()
+        await async_engine.dispose()
+        async_engine = None
         logger.info("Async database connection closed")
 
 
-def close_db():
-    """Close database connections"""
-    global engine
-    
-    if engine:
-        engine.dispose()
-        logger.info("Database connection closed")
-
-
 def get_db():
     """Get database session"""
     db = SessionLocal()
@@ -153,6 +220,13 @@ def get_db():
         db.close()
 
 
-def get_async_db():
-    """Get database session (sync version for now)"""
-    return get_db() 
\ No newline at end of file
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_ro_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session for read-only handlers"""
+    async with AsyncSessionLocalRO() as db:
+        yield db
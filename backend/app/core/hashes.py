@@ -0,0 +1,40 @@
+"""
+Pseudo transaction hash pool for Aztec Protocol Backend
+"""
+
+import asyncio
+import secrets
+from collections import deque
+from typing import Optional
+
+HASH_POOL_SIZE = 1024
+REFILL_WATERMARK = 256
+
+# Pre-generated "0x"-prefixed 32-byte hex hashes
+_HASH_POOL = deque(maxlen=HASH_POOL_SIZE)
+_refill_task: Optional[asyncio.Task] = None
+
+
+def _fill_pool():
+    """Top the pool up to capacity (runs in a worker thread)"""
+    missing = HASH_POOL_SIZE - len(_HASH_POOL)
+    _HASH_POOL.extend("0x" + secrets.token_hex(32) for _ in range(missing))
+
+
+def _schedule_refill():
+    """Refill the pool off the event loop unless a refill is already running"""
+    global _refill_task
+    
+    if _refill_task is None or _refill_task.done():
+        _refill_task = asyncio.get_running_loop().create_task(asyncio.to_thread(_fill_pool))
+
+
+def new_tx_hash() -> str:
+    """Get a fresh pseudo transaction hash"""
+    if len(_HASH_POOL) < REFILL_WATERMARK:
+        _schedule_refill()
+    
+    try:
+        return _HASH_POOL.popleft()
+    except IndexError:
+        return "0x" + secrets.token_hex(32)
@@ -0,0 +1,53 @@
+"""
+Shared outbound HTTP client for Aztec Protocol Backend
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Shared client (created on startup, reused by every request)
+http_client: Optional[httpx.AsyncClient] = None
+
+
+def init_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client used for Pinata/IPFS traffic"""
+    global http_client
+
+    if http_client is None:
+        # Limits must live on the transport: a custom transport ignores client-level limits
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_POOL_MAX,
+                max_keepalive_connections=settings.HTTP_POOL_KEEPALIVE
+            ),
+            retries=settings.HTTP_RETRIES
+        )
+        http_client = httpx.AsyncClient(
+            transport=transport,
+            timeout=settings.HTTP_TIMEOUT_SECONDS
+        )
+        logger.info("HTTP client initialized")
+
+    return http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client"""
+    global http_client
+
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+        logger.info("HTTP client closed")
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client"""
+    return http_client or init_http_client()
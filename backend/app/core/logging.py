@@ -2,9 +2,13 @@
 Logging configuration for Aztec Protocol Backend
 """
 
+import atexit
 import logging
 import logging.config
+import queue
 import sys
+from functools import cached_property
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict, Any
 
@@ -92,6 +96,9 @@ def setup_logging():
     # Apply logging configuration
     logging.config.dictConfig(logging_config)
     
+    # Hand records to background listeners so request paths never block on stream/file I/O
+    _queue_handlers(logging_config["loggers"])
+    
     # Set up structlog for structured logging (optional)
     try:
         import structlog
@@ -119,6 +126,28 @@ def setup_logging():
         pass
 
 
+def _queue_handlers(loggers: Dict[str, Any]):
+    """Replace each logger's handlers with a QueueHandler drained by a QueueListener"""
+    queue_handlers: Dict[tuple, QueueHandler] = {}
+    
+    for name in loggers:
+        target = logging.getLogger(name)
+        handlers = tuple(target.handlers)
+        if not handlers:
+            continue
+        
+        # Loggers sharing a handler set share one queue and listener thread
+        queue_handler = queue_handlers.get(handlers)
+        if queue_handler is None:
+            log_queue = queue.Queue(-1)
+            queue_handler = queue_handlers[handlers] = QueueHandler(log_queue)
+            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+        
+        target.handlers = [queue_handler]
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance"""
     return logging.getLogger(name)
@@ -127,7 +156,8 @@ def get_logger(name: str) -> logging.Logger:
 class LoggerMixin:
     """Mixin to add logging to classes"""
     
-    @property
+    @cached_property
     def logger(self) -> logging.Logger:
-        """Get logger for this class"""
-        return get_logger(f"{self.__class__.__module__}.{self.__class__.__name__}") 
\ No newline at end of file
+        """Get logger for this class (resolved once per instance)"""
+        cls = type(self)
+        return get_logger(cls.__module__ + "." + cls.__qualname__) 
\ No newline at end of file
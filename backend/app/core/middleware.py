@@ -4,108 +4,220 @@ Custom middleware for Aztec Protocol Backend
 
 import time
 import logging
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.middleware.base import RequestResponseEndpoint
+from collections import OrderedDict, deque
+from typing import Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from starlette.middleware.cors import CORSMiddleware
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+def _client_host(scope: Scope) -> str:
+    """Client address from the ASGI scope"""
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RequestLoggingMiddleware:
     """Middleware for logging HTTP requests"""
     
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        start_time = time.time()
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        start_time = time.perf_counter()
         
         # Log request
-        logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"from {request.client.host if request.client else 'unknown'}"
-        )
+        logger.info("Request: %s %s from %s", scope["method"], scope["path"], _client_host(scope))
         
-        # Process request
-        response = await call_next(request)
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                # Calculate processing time
+                process_time = time.perf_counter() - start_time
+                
+                # Log response
+                logger.info("Response: %s took %.3fs", message["status"], process_time)
+                
+                # Add processing time header
+                message.setdefault("headers", []).append(
+                    (b"x-process-time", format(process_time, ".6f").encode())
+                )
+            await send(message)
         
-        # Calculate processing time
-        process_time = time.time() - start_time
+        await self.app(scope, receive, send_wrapper)
+
+
+class LoggingCORSMiddleware(CORSMiddleware):
+    """CORS handling and one access-log line per request in a single ASGI layer"""
+    
+    # Probe and docs traffic is passed through unlogged
+    SKIP_PATHS = frozenset({"/health", "/docs", "/redoc", "/openapi.json"})
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await super().__call__(scope, receive, send)
         
-        # Log response
-        logger.info(
-            f"Response: {response.status_code} "
-            f"took {process_time:.3f}s"
-        )
+        path = scope["path"]
+        if path in self.SKIP_PATHS or not logger.isEnabledFor(logging.INFO):
+            return await super().__call__(scope, receive, send)
         
-        # Add processing time header
-        response.headers["X-Process-Time"] = str(process_time)
+        method = scope["method"]
         
-        return response
+        async def send_wrapper(message: Message):
+            # Log once, when the status line goes out
+            if message["type"] == "http.response.start":
+                logger.info("%s %s - %s", method, path, message["status"])
+            await send(message)
+        
+        await super().__call__(scope, receive, send_wrapper)
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Middleware for rate limiting"""
+# Fixed-window counter: one atomic round-trip per request, shared by every worker
+_RATE_LIMIT_LUA = """
+local n = redis.call('INCR', KEYS[1])
+if n == 1 then redis.call('EXPIRE', KEYS[1], ARGV[1]) end
+return n
+"""
+
+
+class RateLimitMiddleware:
+    """Middleware for rate limiting (Redis-backed, per-process fallback)"""
+    
+    # Window length in seconds
+    WINDOW = 60
     
-    def __init__(self, app, rate_limit: int = None):
-        super().__init__(app)
+    # How long to stay on the local limiter after a Redis error
+    REDIS_RETRY_SECONDS = 5
+    
+    def __init__(self, app: ASGIApp, rate_limit: int = None, max_tracked_ips: int = 10_000, redis_url: Optional[str] = None):
+        self.app = app
         self.rate_limit = rate_limit or settings.RATE_LIMIT_PER_MINUTE
-        self.requests = {}
+        self.max_tracked_ips = max_tracked_ips
+        # Per-IP request times, least recently seen IP first
+        self.requests: "OrderedDict[str, deque[float]]" = OrderedDict()
+        
+        self.redis = aioredis.from_url(redis_url or settings.REDIS_URL)
+        self.redis_script = self.redis.register_script(_RATE_LIMIT_LUA)
+        self.redis_down_until = 0.0
+    
+    async def _over_limit_redis(self, client_ip: str) -> bool:
+        """Count this request in the shared Redis window"""
+        window = int(time.time() // self.WINDOW)
+        count = await self.redis_script(keys=[f"rl:{client_ip}:{window}"], args=[self.WINDOW])
+        return count > self.rate_limit
+    
+    def _over_limit_local(self, client_ip: str, current_time: float) -> bool:
+        """Count this request in the per-process sliding window"""
+        request_times = self.requests.get(client_ip)
+        if request_times is None:
+            request_times = self.requests[client_ip] = deque(maxlen=self.rate_limit + 1)
+            # Forget the least recently seen IPs once the table is full
+            while len(self.requests) > self.max_tracked_ips:
+                self.requests.popitem(last=False)
+        
+        # Drop this IP's timestamps that fell out of the window
+        while request_times and current_time - request_times[0] >= self.WINDOW:
+            request_times.popleft()
+        
+        if len(request_times) >= self.rate_limit:
+            return True
+        
+        request_times.append(current_time)
+        self.requests.move_to_end(client_ip)
+        return False
     
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        client_ip = request.client.host if request.client else "unknown"
-        current_time = time.time()
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        client_ip = _client_host(scope)
+        current_time = time.monotonic()
         
-        # Clean old requests
-        self.requests = {
-            ip: times for ip, times in self.requests.items()
-            if current_time - times[-1] < 60
-        }
+        over_limit = None
+        if current_time >= self.redis_down_until:
+            try:
+                over_limit = await self._over_limit_redis(client_ip)
+            except RedisError as e:
+                logger.warning(f"Rate limit Redis unavailable, using local limiter: {e}")
+                self.redis_down_until = current_time + self.REDIS_RETRY_SECONDS
+        if over_limit is None:
+            over_limit = self._over_limit_local(client_ip, current_time)
         
         # Check rate limit
-        if client_ip in self.requests:
-            request_times = self.requests[client_ip]
-            recent_requests = [t for t in request_times if current_time - t < 60]
-            
-            if len(recent_requests) >= self.rate_limit:
-                logger.warning(f"Rate limit exceeded for {client_ip}")
-                return JSONResponse(
-                    status_code=429,
-                    content={"detail": "Rate limit exceeded"}
-                )
-            
-            self.requests[client_ip] = recent_requests + [current_time]
-        else:
-            self.requests[client_ip] = [current_time]
+        if over_limit:
+            logger.warning(f"Rate limit exceeded for {client_ip}")
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "Rate limit exceeded"}
+            )
+            return await response(scope, receive, send)
         
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
 
-class SecurityMiddleware(BaseHTTPMiddleware):
+class SecurityMiddleware:
     """Middleware for security headers"""
     
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        response = await call_next(request)
+    # Pre-encoded once; appended to every response start
+    HEADERS = (
+        (b"x-content-type-options", b"nosniff"),
+        (b"x-frame-options", b"DENY"),
+        (b"x-xss-protection", b"1; mode=block"),
+        (b"referrer-policy", b"strict-origin-when-cross-origin")
+    )
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
         
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                # Add security headers
+                message["headers"] = [*message.get("headers", ()), *self.HEADERS]
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_wrapper)
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """Middleware for error handling"""
     
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             logger.error(f"Unhandled exception: {e}", exc_info=True)
-            return JSONResponse(
+            # Once headers are on the wire the only option is to drop the connection
+            if response_started:
+                raise
+            response = JSONResponse(
                 status_code=500,
                 content={"detail": "Internal server error"}
-            ) 
\ No newline at end of file
+            )
+            await response(scope, receive, send)
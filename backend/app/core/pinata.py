@@ -0,0 +1,49 @@
+"""
+Pinata IPFS client for Aztec Protocol Backend
+"""
+
+import logging
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.http import get_http_client
+
+logger = logging.getLogger(__name__)
+
+PINATA_API_URL = "https://api.pinata.cloud"
+PIN_FILE_URL = f"{PINATA_API_URL}/pinning/pinFileToIPFS"
+
+# Credentials are fixed for the life of the process (settings are frozen)
+_AUTH_HEADERS = {
+    "pinata_api_key": settings.IPFS_API_KEY or "",
+    "pinata_secret_api_key": settings.IPFS_API_SECRET or ""
+}
+
+
+async def _pin(file_field) -> str:
+    """POST one multipart file field to Pinata and return its CID"""
+    response = await get_http_client().post(
+        PIN_FILE_URL,
+        headers=_AUTH_HEADERS,
+        files={"file": file_field},
+        timeout=None  # uploads scale with file size; the pool still bounds connections
+    )
+    response.raise_for_status()
+
+    ipfs_hash = response.json()["IpfsHash"]
+    logger.info(f"Pinned {file_field[0]} to IPFS: {ipfs_hash}")
+    return ipfs_hash
+
+
+async def pin_file(file_path: str) -> str:
+    """Stream a file to Pinata over the shared HTTP client and return its CID"""
+    path = Path(file_path)
+
+    # httpx streams the multipart body from the open file, so large models are not read into memory
+    with path.open("rb") as f:
+        return await _pin((path.name, f))
+
+
+async def pin_bytes(data: bytes, filename: str, content_type: str = "application/octet-stream") -> str:
+    """Pin an in-memory payload to Pinata without touching the filesystem"""
+    return await _pin((filename, data, content_type))
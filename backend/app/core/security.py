@@ -4,17 +4,29 @@ Security utilities for Aztec Protocol Backend
 
 from datetime import datetime, timedelta
 from typing import Optional
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import select, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import get_async_ro_db
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+
+# Every authenticated request resolves its user by username. The cache holds an
+# immutable snapshot of the user's columns (minus the password hash), never the ORM
+# instance: each request rebuilds its own transient User, so no detached object is
+# shared across requests. The TTL bounds how long an update or deletion goes unseen
+_USER_CACHE: "TTLCache[str, tuple]" = TTLCache(maxsize=10_000, ttl=60)
+_USER_SNAPSHOT_COLUMNS = tuple(c.key for c in User.__table__.columns if c.key != "hashed_password")
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
@@ -42,7 +54,7 @@ def verify_token(token: str) -> Optional[str]:
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_ro_db)
 ) -> User:
     """Get current authenticated user"""
     credentials_exception = HTTPException(
@@ -55,11 +67,16 @@ async def get_current_user(
     if username is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.username == username).first()
-    if user is None:
-        raise credentials_exception
+    snapshot = _USER_CACHE.get(username)
+    if snapshot is None:
+        result = await db.execute(_USER_BY_USERNAME, {"username": username})
+        user = result.scalar_one_or_none()
+        if user is None:
+            raise credentials_exception
+        snapshot = tuple(getattr(user, key) for key in _USER_SNAPSHOT_COLUMNS)
+        _USER_CACHE[username] = snapshot
     
-    return user
+    return User(**dict(zip(_USER_SNAPSHOT_COLUMNS, snapshot)))
 
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
@@ -0,0 +1,37 @@
+"""
+Uvicorn server options for Aztec Protocol Backend
+"""
+
+from importlib.util import find_spec
+
+from app.core.config import settings
+
+# uvloop and httptools ship with uvicorn[standard]; uvloop has no Windows build
+UVICORN_LOOP = "uvloop" if find_spec("uvloop") else "asyncio"
+UVICORN_HTTP = "httptools" if find_spec("httptools") else "h11"
+
+# Debug runs one auto-reloading process; otherwise WORKERS processes (event loop + pool each).
+# One by default: caches and in-flight state are per process, and several workers need a
+# shared SECRET_KEY (enforced in config)
+UVICORN_RELOAD = settings.DEBUG
+UVICORN_WORKERS = 1 if settings.DEBUG else settings.WORKERS or 1
+
+# LoggingCORSMiddleware (app/core/middleware.py) already logs every request; uvicorn's access log is a debug aid
+UVICORN_ACCESS_LOG = settings.DEBUG
+
+# Only parse X-Forwarded-* when a trusted proxy sits in front
+UVICORN_PROXY_HEADERS = settings.BEHIND_PROXY
+
+
+def uvicorn_cli_args() -> list:
+    """The same options as uvicorn command-line flags"""
+    args = ["--loop", UVICORN_LOOP, "--http", UVICORN_HTTP]
+    if UVICORN_RELOAD:
+        args.append("--reload")
+    else:
+        args += ["--workers", str(UVICORN_WORKERS)]
+    if not UVICORN_ACCESS_LOG:
+        args.append("--no-access-log")
+    if not UVICORN_PROXY_HEADERS:
+        args.append("--no-proxy-headers")
+    return args
@@ -2,35 +2,37 @@
 Agent model for Aztec Protocol Backend
 """
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float
+from sqlalchemy import Column, Index, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, func
 from sqlalchemy.orm import relationship
 
-from app.core.database import Base
+from app.core.database import Base, JSONType
 
 
 class Agent(Base):
     """Agent model for AI agents"""
     
     __tablename__ = "agents"
+    __table_args__ = (
+        Index("ix_agents_user_status", "user_id", "status"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
     agent_type = Column(String(50), nullable=False)  # training, inference, etc.
     status = Column(String(20), default="idle")  # idle, training, active, error
-    config = Column(Text, nullable=True)  # JSON configuration
-    performance_metrics = Column(Text, nullable=True)  # JSON metrics
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    config = Column(JSONType, nullable=True)  # configuration
+    performance_metrics = Column(JSONType, nullable=True)  # metrics
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Foreign keys
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Relationships
-    user = relationship("User", back_populates="agents")
-    models = relationship("Model", back_populates="agent")
-    proofs = relationship("Proof", back_populates="agent")
+    user = relationship("User", back_populates="agents", lazy="raise")
+    models = relationship("Model", back_populates="agent", lazy="raise")
+    proofs = relationship("Proof", back_populates="agent", lazy="raise")
     
     def __repr__(self):
         return f"<Agent(id={self.id}, name='{self.name}', type='{self.agent_type}', status='{self.status}')>" 
\ No newline at end of file
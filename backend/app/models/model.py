@@ -2,17 +2,22 @@
 Model model for Aztec Protocol Backend
 """
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float
+from sqlalchemy import Column, Index, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, func
 from sqlalchemy.orm import relationship
 
-from app.core.database import Base
+from app.core.database import Base, JSONType
 
 
 class Model(Base):
     """Model for AI models"""
     
     __tablename__ = "models"
+    __table_args__ = (
+        # Owner-scoped lookups and per-user pagination
+        Index("ix_models_user_id_id", "user_id", "id"),
+        Index("ix_models_user_status", "user_id", "status"),
+        Index("ix_models_agent_status", "agent_id", "status"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
@@ -21,22 +26,23 @@ class Model(Base):
     architecture = Column(String(100), nullable=True)
     parameters = Column(Integer, nullable=True)  # number of parameters
     file_size = Column(Integer, nullable=True)  # size in bytes
+    file_path = Column(String(500), nullable=True)  # local path of the uploaded file
     ipfs_hash = Column(String(255), nullable=True)  # IPFS hash
     accuracy = Column(Float, nullable=True)
     loss = Column(Float, nullable=True)
-    training_config = Column(Text, nullable=True)  # JSON training config
+    training_config = Column(JSONType, nullable=True)  # training config
     status = Column(String(20), default="uploaded")  # uploaded, training, ready, error
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Foreign keys
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     agent_id = Column(Integer, ForeignKey("agents.id"), nullable=True)
     
     # Relationships
-    user = relationship("User", back_populates="models")
-    agent = relationship("Agent", back_populates="models")
-    proofs = relationship("Proof", back_populates="model")
+    user = relationship("User", back_populates="models", lazy="raise")
+    agent = relationship("Agent", back_populates="models", lazy="raise")
+    proofs = relationship("Proof", back_populates="model", lazy="raise")
     
     def __repr__(self):
         return f"<Model(id={self.id}, name='{self.name}', type='{self.model_type}', status='{self.status}')>" 
\ No newline at end of file
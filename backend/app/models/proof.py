@@ -2,31 +2,44 @@
 Proof model for Aztec Protocol Backend
 """
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Index, Integer, String, Boolean, DateTime, ForeignKey, Float, func, text
+from sqlalchemy.orm import deferred, relationship
 
-from app.core.database import Base
+from app.core.database import Base, JSONType
 
 
 class Proof(Base):
     """Model for ZK proofs"""
     
     __tablename__ = "proofs"
+    __table_args__ = (
+        # Owner-scoped lookups and per-user pagination
+        Index("ix_proofs_user_id_id", "user_id", "id"),
+        Index("ix_proofs_user_created", "user_id", "created_at"),
+        Index("ix_proofs_round_status", "round_id", "verification_status"),
+        # Partial index: only the small set of proofs still awaiting verification
+        Index(
+            "ix_proofs_pending",
+            "created_at",
+            postgresql_where=text("verification_status = 'pending'"),
+            sqlite_where=text("verification_status = 'pending'")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     proof_type = Column(String(50), nullable=False)  # training_proof, data_integrity, model_diff
     proof_hash = Column(String(255), nullable=False, unique=True)
-    proof_data = Column(Text, nullable=True)  # JSON proof data
+    # Large payloads are deferred so list/lookup queries leave them out of the row
+    proof_data = deferred(Column(JSONType, nullable=True))  # proof data
     ipfs_hash = Column(String(255), nullable=True)  # IPFS hash of proof
+    ipfs_status = Column(String(20), nullable=True)  # uploading, ready, error
     verification_status = Column(String(20), default="pending")  # pending, verified, failed
     verification_result = Column(Boolean, nullable=True)
     verification_time = Column(Float, nullable=True)  # verification time in seconds
     circuit_name = Column(String(100), nullable=True)  # Noir circuit name
-    public_inputs = Column(Text, nullable=True)  # JSON public inputs
-    private_inputs = Column(Text, nullable=True)  # JSON private inputs (encrypted)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    public_inputs = deferred(Column(JSONType, nullable=True))  # public inputs
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Foreign keys
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -35,10 +48,22 @@ class Proof(Base):
     round_id = Column(Integer, ForeignKey("rounds.id"), nullable=True)
     
     # Relationships
-    user = relationship("User", back_populates="proofs")
-    agent = relationship("Agent", back_populates="proofs")
-    model = relationship("Model", back_populates="proofs")
-    round = relationship("Round", back_populates="proofs")
+    user = relationship("User", back_populates="proofs", lazy="raise")
+    agent = relationship("Agent", back_populates="proofs", lazy="raise")
+    model = relationship("Model", back_populates="proofs", lazy="raise")
+    round = relationship("Round", back_populates="proofs", lazy="raise")
+    # Private inputs live in proof_blobs; load explicitly with selectinload/joinedload.
+    # passive_deletes: the ORM leaves blob rows to ON DELETE CASCADE / delete_proof
+    blob = relationship("ProofBlob", uselist=False, lazy="raise", passive_deletes=True)
     
     def __repr__(self):
-        return f"<Proof(id={self.id}, type='{self.proof_type}', hash='{self.proof_hash}', status='{self.verification_status}')>" 
\ No newline at end of file
+        return f"<Proof(id={self.id}, type='{self.proof_type}', hash='{self.proof_hash}', status='{self.verification_status}')>"
+
+
+class ProofBlob(Base):
+    """Private proof inputs, kept out of the proofs row"""
+    
+    __tablename__ = "proof_blobs"
+    
+    proof_id = Column(Integer, ForeignKey("proofs.id", ondelete="CASCADE"), primary_key=True)
+    private_inputs = Column(JSONType, nullable=True)  # private inputs (encrypted)
@@ -2,8 +2,7 @@
 Round model for Aztec Protocol Backend
 """
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float
+from sqlalchemy import Column, Index, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -13,6 +12,9 @@ class Round(Base):
     """Model for collaboration rounds"""
     
     __tablename__ = "rounds"
+    __table_args__ = (
+        Index("ix_rounds_creator_status", "creator_id", "status"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
@@ -23,15 +25,15 @@ class Round(Base):
     max_participants = Column(Integer, nullable=True)
     start_time = Column(DateTime, nullable=True)
     end_time = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Foreign keys
     creator_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Relationships
-    creator = relationship("User")
-    proofs = relationship("Proof", back_populates="round")
+    creator = relationship("User", lazy="raise")
+    proofs = relationship("Proof", back_populates="round", lazy="raise")
     
     def __repr__(self):
         return f"<Round(id={self.id}, name='{self.name}', status='{self.status}', bounty={self.bounty_amount})>" 
\ No newline at end of file
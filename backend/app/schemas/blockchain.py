@@ -0,0 +1,79 @@
+"""
+Blockchain schemas for Aztec Protocol Backend
+"""
+
+from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BlockchainStatusResponse(BaseModel):
+    """Blockchain status response schema"""
+    network: str
+    rpc_url: str
+    connected: bool
+    latest_block: Optional[int] = None
+    gas_price: Optional[str] = None
+    contracts: Optional[Dict[str, str]] = None
+    status: str
+    error: Optional[str] = None
+
+
+class ContractsResponse(BaseModel):
+    """Deployed contracts response schema"""
+    contracts: Dict[str, str]
+    network: str
+    deployment_info: Dict[str, Any]
+
+
+class TransactionResponse(BaseModel):
+    """Blockchain transaction schema"""
+    model_config = ConfigDict(populate_by_name=True)
+    
+    hash: str
+    from_: Optional[str] = Field(None, alias="from")
+    to: Optional[str] = None
+    value: str
+    gas_used: int
+    gas_price: str
+    block_number: int
+    timestamp: str
+    status: str
+    method: str
+
+
+class TransactionListResponse(BaseModel):
+    """Blockchain transaction list response schema"""
+    address: Optional[str] = None
+    transactions: List[TransactionResponse]
+    total: int
+
+
+class ContractEventResponse(BaseModel):
+    """Contract event schema"""
+    address: Optional[str] = None
+    event: str
+    log_index: int
+    transaction_hash: str
+    block_number: int
+    block_hash: str
+    data: Dict[str, Any]
+
+
+class ContractEventListResponse(BaseModel):
+    """Contract event list response schema"""
+    contract_address: Optional[str] = None
+    from_block: int
+    to_block: int
+    events: List[ContractEventResponse]
+    total: int
+
+
+class GasEstimateResponse(BaseModel):
+    """Gas estimate response schema"""
+    contract_address: str
+    method: str
+    params: Dict[str, Any]
+    estimated_gas: int
+    gas_price: str
+    estimated_cost_wei: int
+    estimated_cost_eth: float
@@ -3,16 +3,26 @@ Main FastAPI application for Aztec Protocol Backend
 """
 
 import os
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+from typing import Any, Dict
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 
 from app.core.config import settings
-from app.core.database import init_db
+from app.core.clock import now_iso, run_clock
+from app.core import database
+from app.core.database import init_db, init_async_db, close_db
+from app.core.http import init_http_client, close_http_client
+from app.core.middleware import LoggingCORSMiddleware
 from app.api.v1.api import api_router
+from app.api.v1.endpoints.ipfs import refresh_ipfs_status_loop
 
 # Import all models to ensure they are registered with SQLAlchemy
 from app.models import user, agent, model, proof, round
@@ -24,21 +34,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Custom logging middleware"""
-    
-    async def dispatch(self, request: Request, call_next):
-        # Log request
-        logger.info(f"{request.method} {request.url.path}")
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Log response
-        logger.info(f"{request.method} {request.url.path} - {response.status_code}")
-        
-        return response
+# Settings read on every request, bound once at import
+_VERSION = settings.VERSION
+_DEBUG = settings.DEBUG
 
 
 @asynccontextmanager
@@ -50,6 +48,7 @@ async def lifespan(app: FastAPI):
     # Initialize database
     try:
         init_db()
+        await init_async_db()
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
@@ -59,12 +58,23 @@ async def lifespan(app: FastAPI):
     os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
     os.makedirs(settings.MODEL_CACHE_DIR, exist_ok=True)
     
+    # Open the shared outbound HTTP connection pool
+    init_http_client()
+    
+    # Background refreshers: cached clock and IPFS credential status
+    clock_task = asyncio.create_task(run_clock())
+    ipfs_status_task = asyncio.create_task(refresh_ipfs_status_loop())
+    
     logger.info("Backend startup complete")
     
     yield
     
     # Shutdown
     logger.info("Shutting down Aztec Protocol Backend...")
+    clock_task.cancel()
+    ipfs_status_task.cancel()
+    await close_http_client()
+    await close_db()
 
 
 # Create FastAPI app
@@ -77,68 +87,120 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# Add CORS middleware
+# Compress JSON responses (contract/event payloads are mostly hex strings).
+# Added first so it sits inside CORS and only wraps the application's own responses
 app.add_middleware(
-    CORSMiddleware,
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL
+)
+
+# CORS and request logging share one outermost layer
+app.add_middleware(
+    LoggingCORSMiddleware,
     allow_origins=settings.ALLOWED_HOSTS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Add logging middleware
-app.add_middleware(LoggingMiddleware)
-
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler"""
-    logger.error(f"Unhandled exception: {exc}")
+    logger.error("Unhandled exception: %s", exc)
     return JSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
-            "error": str(exc) if settings.DEBUG else "An unexpected error occurred"
+            "error": str(exc) if _DEBUG else "An unexpected error occurred"
         }
     )
 
 
+# Static payloads: settings are frozen, so serialize once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to Aztec Protocol Backend",
+    "version": settings.VERSION,
+    "docs": "/docs",
+    "health": "/health"
+})
+
+_INFO_BODY = orjson.dumps({
+    "app_name": settings.APP_NAME,
+    "version": settings.VERSION,
+    "debug": settings.DEBUG,
+    "environment": "development" if settings.DEBUG else "production",
+    "features": {
+        "authentication": True,
+        "agents": True,
+        "models": True,
+        "proofs": True,
+        "ipfs": True,
+        "blockchain": True,
+        "zk_proofs": True
+    },
+    "endpoints": {
+        "docs": "/docs",
+        "redoc": "/redoc",
+        "health": "/health",
+        "api": "/api/v1"
+    }
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Welcome to Aztec Protocol Backend",
-        "version": settings.VERSION,
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
+
+
+_HEALTH_QUERY = text("SELECT 1")
+
+# Seconds a health probe may wait on the database before reporting unhealthy
+_HEALTH_DB_TIMEOUT = 5
+
+# Integration config is frozen for the life of the process
+_IPFS_STATUS = "configured" if settings.IPFS_API_KEY and settings.IPFS_API_SECRET else "not_configured"
+_BLOCKCHAIN_STATUS = "configured" if settings.ETHEREUM_RPC_URL else "not_configured"
+
+
+async def _ping_database(engine):
+    """Run SELECT 1 on a pooled connection (no session)"""
+    async with engine.connect() as conn:
+        await conn.execute(_HEALTH_QUERY)
+
+
+def _pool_stats(pool) -> Dict[str, int]:
+    """Occupancy of a QueuePool; other pool classes (StaticPool for :memory:) report nothing"""
+    if not isinstance(pool, QueuePool):
+        return {}
+    # overflow() counts up from -size until the pool is full; report only real overflow
+    return {"size": pool.size(), "checked_out": pool.checkedout(), "overflow": max(pool.overflow(), 0)}
 
 
 @app.get("/health")
-async def health_check():
+async def health_check() -> Dict[str, Any]:
     """Health check endpoint"""
     try:
-        # Check database connection
-        from app.core.database import get_db
-        from sqlalchemy import text
-        db = next(get_db())
-        db.execute(text("SELECT 1"))
-        db.close()
-        
-        # Check IPFS configuration
-        ipfs_configured = bool(settings.IPFS_API_KEY and settings.IPFS_API_SECRET)
-        
-        # Check blockchain configuration
-        blockchain_configured = bool(settings.ETHEREUM_RPC_URL)
+        # Check database connection without letting a stuck database hang the probe.
+        # The read engine keeps the probe off SQLite's single writer connection, and its
+        # pool is the one reported
+        engine = database.async_ro_engine
+        await asyncio.wait_for(_ping_database(engine), _HEALTH_DB_TIMEOUT)
         
-        return {
+        body = {
             "status": "healthy",
-            "version": settings.VERSION,
+            "version": _VERSION,
             "database": "connected",
-            "ipfs": "configured" if ipfs_configured else "not_configured",
-            "blockchain": "configured" if blockchain_configured else "not_configured",
-            "timestamp": "2024-01-01T00:00:00Z"
+            "ipfs": _IPFS_STATUS,
+            "blockchain": _BLOCKCHAIN_STATUS,
+            "timestamp": now_iso()
         }
+        pool_stats = _pool_stats(engine.pool)
+        if pool_stats:
+            body["db_pool"] = pool_stats
+        return body
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         raise HTTPException(status_code=503, detail="Service unhealthy")
@@ -147,27 +209,7 @@ async def health_check():
 @app.get("/info")
 async def get_info():
     """Get application information"""
-    return {
-        "app_name": settings.APP_NAME,
-        "version": settings.VERSION,
-        "debug": settings.DEBUG,
-        "environment": "development" if settings.DEBUG else "production",
-        "features": {
-            "authentication": True,
-            "agents": True,
-            "models": True,
-            "proofs": True,
-            "ipfs": True,
-            "blockchain": True,
-            "zk_proofs": True
-        },
-        "endpoints": {
-            "docs": "/docs",
-            "redoc": "/redoc",
-            "health": "/health",
-            "api": "/api/v1"
-        }
-    }
+    return Response(_INFO_BODY, media_type="application/json")
 
 
 # Include API router
@@ -176,11 +218,19 @@ app.include_router(api_router, prefix="/api/v1")
 
 if __name__ == "__main__":
     import uvicorn
+    from app.core.server import (
+        UVICORN_LOOP, UVICORN_HTTP, UVICORN_RELOAD, UVICORN_WORKERS, UVICORN_ACCESS_LOG, UVICORN_PROXY_HEADERS
+    )
     
     uvicorn.run(
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG,
-        log_level=settings.LOG_LEVEL.lower()
+        reload=UVICORN_RELOAD,
+        workers=UVICORN_WORKERS,
+        log_level=settings.LOG_LEVEL.lower(),
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP,
+        access_log=UVICORN_ACCESS_LOG,
+        proxy_headers=UVICORN_PROXY_HEADERS
     )
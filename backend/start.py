@@ -14,6 +14,9 @@ sys.path.insert(0, str(backend_dir))
 
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.core.server import (
+    UVICORN_LOOP, UVICORN_HTTP, UVICORN_RELOAD, UVICORN_WORKERS, UVICORN_ACCESS_LOG, UVICORN_PROXY_HEADERS
+)
 
 def main():
     """Start the Aztec Protocol Backend"""
@@ -39,8 +42,13 @@ def main():
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG,
-        log_level="info"
+        reload=UVICORN_RELOAD,
+        workers=UVICORN_WORKERS,
+        log_level="info",
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP,
+        access_log=UVICORN_ACCESS_LOG,
+        proxy_headers=UVICORN_PROXY_HEADERS
     )
 
 if __name__ == "__main__":
@@ -4,11 +4,12 @@ Comprehensive startup script for Aztec Protocol Backend
 """
 
 import os
+import shutil
 import sys
 import subprocess
 import time
 import requests
-from pathlib import Path
+from importlib.util import find_spec
 
 def check_python_version():
     """Check Python version"""
@@ -27,12 +28,8 @@ def check_dependencies():
         "requests"
     ]
     
-    missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec locates each package without executing it
+    missing_packages = [package for package in required_packages if find_spec(package) is None]
     
     if missing_packages:
         print(f"❌ Missing packages: {', '.join(missing_packages)}")
@@ -54,17 +51,17 @@ def setup_environment():
     ]
     
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
-        print(f"✅ Created directory: {directory}")
+        os.makedirs(directory, exist_ok=True)
+    print(f"✅ Directories ready: {', '.join(directories)}")
     
     # Check if .env exists
     if not os.path.exists(".env"):
         print("⚠️  .env file not found. Creating from .env.example...")
-        if os.path.exists(".env.example"):
-            import shutil
-            shutil.copy(".env.example", ".env")
+        try:
+            # copyfile copies contents only, skipping copy()'s extra permission syscalls
+            shutil.copyfile(".env.example", ".env")
             print("✅ Created .env from .env.example")
-        else:
+        except FileNotFoundError:
             print("❌ .env.example not found. Please create .env manually.")
             sys.exit(1)
     else:
@@ -75,17 +72,23 @@ def check_database():
     print("\n🗄️  Checking database...")
     
     try:
-        from app.core.database import init_db, get_db
+        from app.core.config import settings
+        from app.core import database
+        from app.core.database import init_db
         from sqlalchemy import text
         
+        # Bring the schema up to date when the app is not creating tables itself
+        if not settings.AUTO_CREATE_TABLES:
+            subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], check=True)
+            print("✅ Database migrated")
+        
         # Initialize database
         init_db()
         print("✅ Database initialized")
         
         # Test connection
-        db = next(get_db())
-        result = db.execute(text("SELECT 1"))
-        db.close()
+        with database.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
         print("✅ Database connection successful")
         
     except Exception as e:
@@ -142,13 +145,15 @@ def start_server():
     print("\n🚀 Starting Aztec Protocol Backend...")
     
     try:
+        from app.core.server import uvicorn_cli_args
+        
         # Start server with uvicorn
         cmd = [
             sys.executable, "-m", "uvicorn",
             "main:app",
             "--host", "0.0.0.0",
             "--port", "8000",
-            "--reload"
+            *uvicorn_cli_args()
         ]
         
         print(f"Running: {' '.join(cmd)}")
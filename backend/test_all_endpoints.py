@@ -4,12 +4,18 @@ Comprehensive API endpoint test script
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 def test_all_endpoints():
     """Test all API endpoints"""
     base_url = "http://localhost:8000"
     
+    # One keep-alive connection pool for every request in the run
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+    
     print("🚀 Testing Aztec Protocol Backend - All Endpoints")
     print("=" * 60)
     
@@ -19,7 +25,7 @@ def test_all_endpoints():
             "username": "testuser",
             "password": "testpassword123"
         }
-        response = requests.post(f"{base_url}/api/v1/auth/token", data=login_data)
+        response = session.post(f"{base_url}/api/v1/auth/token", data=login_data)
         if response.status_code == 200:
             token = response.json().get("access_token")
             headers = {"Authorization": f"Bearer {token}"}
@@ -42,9 +48,21 @@ def test_all_endpoints():
         ("GET", "/api/v1/ipfs/status", "IPFS Status"),
     ]
     
-    for method, endpoint, name in endpoints:
+    def fetch(entry):
+        method, endpoint, _ = entry
+        try:
+            return session.request(method, f"{base_url}{endpoint}", headers=headers)
+        except Exception as e:
+            return e
+    
+    # Issue every request at once; results are reported in list order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(executor.map(fetch, endpoints))
+    
+    for (method, endpoint, name), response in zip(endpoints, responses):
         try:
-            response = requests.request(method, f"{base_url}{endpoint}", headers=headers)
+            if isinstance(response, Exception):
+                raise response
             status = "✅" if response.status_code == 200 else "⚠️"
             print(f"{status} {name}: {response.status_code}")
             if response.status_code == 200:
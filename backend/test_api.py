@@ -4,17 +4,22 @@ Simple API test script
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
 
 def test_api():
     """Test API endpoints"""
     base_url = "http://localhost:8000"
     
+    # One keep-alive connection pool for every request in the run
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+    
     print("Testing API endpoints...")
     
     # Test root endpoint
     try:
-        response = requests.get(f"{base_url}/")
+        response = session.get(f"{base_url}/")
         print(f"Root endpoint: {response.status_code}")
         if response.status_code == 200:
             print(f"Response: {response.json()}")
@@ -23,7 +28,7 @@ def test_api():
     
     # Test API v1 root
     try:
-        response = requests.get(f"{base_url}/api/v1/")
+        response = session.get(f"{base_url}/api/v1/")
         print(f"API v1 root: {response.status_code}")
         if response.status_code == 200:
             print(f"Response: {response.json()}")
@@ -32,7 +37,7 @@ def test_api():
     
     # Test health endpoint
     try:
-        response = requests.get(f"{base_url}/health")
+        response = session.get(f"{base_url}/health")
         print(f"Health endpoint: {response.status_code}")
         if response.status_code == 200:
             print(f"Response: {response.json()}")
@@ -41,7 +46,7 @@ def test_api():
     
     # Test auth endpoint
     try:
-        response = requests.get(f"{base_url}/api/v1/auth")
+        response = session.get(f"{base_url}/api/v1/auth")
         print(f"Auth endpoint: {response.status_code}")
         if response.status_code == 200:
             print(f"Response: {response.json()}")
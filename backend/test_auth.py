@@ -4,12 +4,17 @@ Auth endpoint test script
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
 def test_auth_endpoints():
     """Test authentication endpoints"""
     base_url = "http://localhost:8000"
     
+    # One keep-alive connection pool for every request in the run
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+    
     print("Testing Auth endpoints...")
     
     # Test auth register endpoint
@@ -20,7 +25,7 @@ def test_auth_endpoints():
             "password": "testpassword123",
             "full_name": "Test User"
         }
-        response = requests.post(f"{base_url}/api/v1/auth/register", json=user_data)
+        response = session.post(f"{base_url}/api/v1/auth/register", json=user_data)
         print(f"Register endpoint: {response.status_code}")
         if response.status_code == 200:
             print(f"Response: {response.json()}")
@@ -35,7 +40,7 @@ def test_auth_endpoints():
             "username": "testuser",
             "password": "testpassword123"
         }
-        response = requests.post(f"{base_url}/api/v1/auth/token", data=login_data)
+        response = session.post(f"{base_url}/api/v1/auth/token", data=login_data)
         print(f"Token endpoint: {response.status_code}")
         if response.status_code == 200:
             print(f"Response: {response.json()}")
@@ -3,7 +3,8 @@
 Comprehensive test script for Aztec Protocol Backend
 """
 
-import requests
+import asyncio
+import httpx
 import json
 import time
 from typing import Dict, Any
@@ -62,13 +63,13 @@ TEST_TRAINING_DATA = {
     "num_classes": 2
 }
 
-class BackendTester:
-    def __init__(self):
-        self.session = requests.Session()
+class AsyncBackendTester:
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
         self.access_token = None
         self.test_results = []
     
-    def log_test(self, test_name: str, success: bool, response: requests.Response = None, error: str = None):
+    def log_test(self, test_name: str, success: bool, response: httpx.Response = None, error: str = None):
         """Log test result"""
         result = {
             "test": test_name,
@@ -90,19 +91,19 @@ class BackendTester:
             headers["Authorization"] = f"Bearer {self.access_token}"
         return headers
     
-    def test_health_check(self):
+    async def test_health_check(self):
         """Test health check endpoint"""
         try:
-            response = self.session.get(f"{BASE_URL}/health")
+            response = await self.client.get(f"{BASE_URL}/health")
             success = response.status_code == 200
             self.log_test("Health Check", success, response)
         except Exception as e:
             self.log_test("Health Check", False, error=str(e))
     
-    def test_register_user(self):
+    async def test_register_user(self):
         """Test user registration"""
         try:
-            response = self.session.post(
+            response = await self.client.post(
                 f"{API_BASE}/auth/register",
                 json=TEST_USER,
                 headers=self.get_headers()
@@ -112,14 +113,14 @@ class BackendTester:
         except Exception as e:
             self.log_test("User Registration", False, error=str(e))
     
-    def test_login(self):
+    async def test_login(self):
         """Test user login"""
         try:
             login_data = {
                 "username": TEST_USER["email"],
                 "password": TEST_USER["password"]
             }
-            response = self.session.post(
+            response = await self.client.post(
                 f"{API_BASE}/auth/token",
                 data=login_data,
                 headers={"Content-Type": "application/x-www-form-urlencoded"}
@@ -132,10 +133,10 @@ class BackendTester:
         except Exception as e:
             self.log_test("User Login", False, error=str(e))
     
-    def test_get_current_user(self):
+    async def test_get_current_user(self):
         """Test get current user"""
         try:
-            response = self.session.get(
+            response = await self.client.get(
                 f"{API_BASE}/auth/me",
                 headers=self.get_headers()
             )
@@ -144,10 +145,10 @@ class BackendTester:
         except Exception as e:
             self.log_test("Get Current User", False, error=str(e))
     
-    def test_create_agent(self):
+    async def test_create_agent(self):
         """Test agent creation"""
         try:
-            response = self.session.post(
+            response = await self.client.post(
                 f"{API_BASE}/agents",
                 json=TEST_AGENT,
                 headers=self.get_headers()
@@ -157,10 +158,10 @@ class BackendTester:
         except Exception as e:
             self.log_test("Create Agent", False, error=str(e))
     
-    def test_list_agents(self):
+    async def test_list_agents(self):
         """Test list agents"""
         try:
-            response = self.session.get(
+            response = await self.client.get(
                 f"{API_BASE}/agents",
                 headers=self.get_headers()
             )
@@ -169,10 +170,10 @@ class BackendTester:
         except Exception as e:
             self.log_test("List Agents", False, error=str(e))
     
-    def test_create_model(self):
+    async def test_create_model(self):
         """Test model creation"""
         try:
-            response = self.session.post(
+            response = await self.client.post(
                 f"{API_BASE}/models",
                 json=TEST_MODEL,
                 headers=self.get_headers()
@@ -182,10 +183,10 @@ class BackendTester:
         except Exception as e:
             self.log_test("Create Model", False, error=str(e))
     
-    def test_list_models(self):
+    async def test_list_models(self):
         """Test list models"""
         try:
-            response = self.session.get(
+            response = await self.client.get(
                 f"{API_BASE}/models",
                 headers=self.get_headers()
             )
@@ -194,10 +195,10 @@ class BackendTester:
         except Exception as e:
             self.log_test("List Models", False, error=str(e))
     
-    def test_generate_proof(self):
+    async def test_generate_proof(self):
         """Test proof generation"""
         try:
-            response = self.session.post(
+            response = await self.client.post(
                 f"{API_BASE}/proofs/generate",
                 json=TEST_TRAINING_DATA,
                 headers=self.get_headers()
@@ -207,10 +208,10 @@ class BackendTester:
         except Exception as e:
             self.log_test("Generate Proof", False, error=str(e))
     
-    def test_list_proofs(self):
+    async def test_list_proofs(self):
         """Test list proofs"""
         try:
-            response = self.session.get(
+            response = await self.client.get(
                 f"{API_BASE}/proofs",
                 headers=self.get_headers()
             )
@@ -219,10 +220,10 @@ class BackendTester:
         except Exception as e:
             self.log_test("List Proofs", False, error=str(e))
     
-    def test_ipfs_status(self):
+    async def test_ipfs_status(self):
         """Test IPFS status"""
         try:
-            response = self.session.get(
+            response = await self.client.get(
                 f"{API_BASE}/ipfs/status",
                 headers=self.get_headers()
             )
@@ -231,10 +232,10 @@ class BackendTester:
         except Exception as e:
             self.log_test("IPFS Status", False, error=str(e))
     
-    def test_blockchain_status(self):
+    async def test_blockchain_status(self):
         """Test blockchain status"""
         try:
-            response = self.session.get(
+            response = await self.client.get(
                 f"{API_BASE}/blockchain/status",
                 headers=self.get_headers()
             )
@@ -243,10 +244,10 @@ class BackendTester:
         except Exception as e:
             self.log_test("Blockchain Status", False, error=str(e))
     
-    def test_get_contracts(self):
+    async def test_get_contracts(self):
         """Test get contract addresses"""
         try:
-            response = self.session.get(
+            response = await self.client.get(
                 f"{API_BASE}/blockchain/contracts",
                 headers=self.get_headers()
             )
@@ -255,68 +256,56 @@ class BackendTester:
         except Exception as e:
             self.log_test("Get Contracts", False, error=str(e))
     
-    def test_upload_to_ipfs(self):
+    async def test_upload_to_ipfs(self):
         """Test IPFS upload"""
         try:
-            # Create a test file
-            test_file_content = "This is a test file for IPFS upload"
-            with open("test_file.txt", "w") as f:
-                f.write(test_file_content)
+            # Upload an in-memory test file
+            test_file_content = b"This is a test file for IPFS upload"
+            files = {"file": ("test_file.txt", test_file_content, "text/plain")}
+            data = {"metadata": json.dumps({"description": "Test file"})}
             
-            with open("test_file.txt", "rb") as f:
-                files = {"file": ("test_file.txt", f, "text/plain")}
-                data = {"metadata": json.dumps({"description": "Test file"})}
-                
-                response = self.session.post(
-                    f"{API_BASE}/ipfs/upload",
-                    files=files,
-                    data=data,
-                    headers={"Authorization": f"Bearer {self.access_token}"} if self.access_token else {}
-                )
+            response = await self.client.post(
+                f"{API_BASE}/ipfs/upload",
+                files=files,
+                data=data,
+                headers={"Authorization": f"Bearer {self.access_token}"} if self.access_token else {}
+            )
             
             success = response.status_code == 200
             self.log_test("IPFS Upload", success, response)
-            
-            # Clean up test file
-            import os
-            if os.path.exists("test_file.txt"):
-                os.remove("test_file.txt")
-                
         except Exception as e:
             self.log_test("IPFS Upload", False, error=str(e))
     
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all tests"""
         print("🚀 Starting Aztec Protocol Backend Tests")
         print("=" * 50)
         
         # Health check first
-        self.test_health_check()
-        
-        # Authentication tests
-        self.test_register_user()
-        self.test_login()
-        self.test_get_current_user()
-        
-        # Agent tests
-        self.test_create_agent()
-        self.test_list_agents()
+        await self.test_health_check()
         
-        # Model tests
-        self.test_create_model()
-        self.test_list_models()
+        # Authentication tests (each step needs the previous one)
+        await self.test_register_user()
+        await self.test_login()
+        await self.test_get_current_user()
         
-        # Proof tests
-        self.test_generate_proof()
-        self.test_list_proofs()
+        # Create agent/model/proof and upload to IPFS concurrently
+        await asyncio.gather(
+            self.test_create_agent(),
+            self.test_create_model(),
+            self.test_generate_proof(),
+            self.test_upload_to_ipfs()
+        )
         
-        # IPFS tests
-        self.test_ipfs_status()
-        self.test_upload_to_ipfs()
-        
-        # Blockchain tests
-        self.test_blockchain_status()
-        self.test_get_contracts()
+        # Independent read-only checks, run concurrently
+        await asyncio.gather(
+            self.test_list_agents(),
+            self.test_list_models(),
+            self.test_list_proofs(),
+            self.test_ipfs_status(),
+            self.test_blockchain_status(),
+            self.test_get_contracts()
+        )
         
         # Print summary
         print("\n" + "=" * 50)
@@ -339,12 +328,15 @@ class BackendTester:
         
         return passed == total
 
+async def run_tests() -> bool:
+    """Run the suite over one pooled client (HTTP/2 when the server offers it)"""
+    async with httpx.AsyncClient(http2=True, timeout=30, follow_redirects=True) as client:
+        return await AsyncBackendTester(client).run_all_tests()
+
 def main():
     """Main test function"""
-    tester = BackendTester()
-    
     try:
-        success = tester.run_all_tests()
+        success = asyncio.run(run_tests())
         if success:
             print("\n🎉 All tests passed! Backend is working correctly.")
         else:
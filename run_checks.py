@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Run every frontend/backend check in one process, sharing one interpreter and connection pool
+"""
+
+from _probe import configure_logging
+from test_frontend import test_frontend
+from test_integration import test_integration
+from test_landing import test_landing_page
+
+if __name__ == "__main__":
+    configure_logging()
+    test_frontend()
+    test_integration()
+    test_landing_page()
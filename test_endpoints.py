@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Frontend and backend endpoint checks as one parametrized pytest module
+
+Runs against live servers (frontend on :3000, backend on :8000); checks for a server
+that is not running are skipped. Fan out with pytest-xdist: pytest test_endpoints.py -n auto
+"""
+
+import httpx
+import pytest
+
+from _probe import (
+    BACKEND_ENDPOINTS, BACKEND_URL, FRONTEND_PAGES, FRONTEND_URL, LANDING_NEEDLES, LANDING_PAGE,
+    LIMITS, TIMEOUT, scan_body
+)
+
+@pytest.fixture(scope="session")
+def client():
+    """One pooled client for the whole session; HTTP/2 wherever the server negotiates it"""
+    with httpx.Client(
+        http2=True, limits=LIMITS, timeout=TIMEOUT, headers={"Accept-Encoding": "identity"}
+    ) as client:
+        yield client
+
+def _reachable(client, base_url):
+    """Skip every check against a server that is not listening"""
+    try:
+        client.head(base_url)  # any status will do, FastAPI answers HEAD with 405
+    except httpx.TransportError as e:
+        pytest.skip(f"{base_url} not reachable: {e}")
+    return base_url
+
+@pytest.fixture(scope="session")
+def frontend(client):
+    return _reachable(client, FRONTEND_URL)
+
+@pytest.fixture(scope="session")
+def backend(client):
+    return _reachable(client, BACKEND_URL)
+
+@pytest.mark.parametrize("page", FRONTEND_PAGES)
+def test_frontend_page(client, frontend, page):
+    assert client.get(frontend + page).status_code == 200
+
+@pytest.mark.parametrize("needle", LANDING_NEEDLES, ids=bytes.decode)
+def test_landing_page_content(client, frontend, needle):
+    with client.stream("GET", frontend + LANDING_PAGE) as response:
+        assert response.status_code == 200
+        _, found = scan_body(response, (needle,))
+    assert needle in found
+
+@pytest.mark.parametrize("endpoint", BACKEND_ENDPOINTS)
+def test_backend_endpoint(client, backend, endpoint):
+    assert client.get(backend + endpoint).status_code == 200
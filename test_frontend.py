@@ -3,31 +3,47 @@
 Test frontend accessibility
 """
 
-import requests
-import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger("probe")
 
 def test_frontend():
     """Test frontend accessibility"""
-    print("🌐 Testing Frontend Accessibility...")
+    from _probe import AZTEC, FRONTEND_PAGES, FRONTEND_URL, fetch
+    
+    log.info("🌐 Testing Frontend Accessibility...")
     
     # Test different URLs
-    urls = [
-        "http://localhost:3000/",
-        "http://localhost:3000/index.html",
-        "http://localhost:3000/dashboard.html",
-        "http://localhost:3000/results.html"
-    ]
+    urls = tuple(FRONTEND_URL + page for page in FRONTEND_PAGES)
+    
+    def check(url):
+        return fetch(url, (AZTEC,))
+    
+    # Probe every URL at once; results are reported in list order
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        responses = list(executor.map(check, urls))
     
-    for url in urls:
-        try:
-            response = requests.get(url, timeout=5)
-            print(f"✅ {url}: {response.status_code}")
-            if response.status_code == 200:
-                print(f"   📄 Content length: {len(response.text)} characters")
-                if "Aztec Protocol" in response.text:
-                    print("   🎯 Found 'Aztec Protocol' in content")
-        except Exception as e:
-            print(f"❌ {url}: {e}")
+    # Failures are logged as they are found; the success report is built only when INFO
+    # is enabled and emitted in one call instead of a line per call
+    verbose = log.isEnabledFor(logging.INFO)
+    out = []
+    for url, result in zip(urls, responses):
+        if isinstance(result, Exception):
+            log.error("❌ %s: %s", url, result)
+            continue
+        if not verbose:
+            continue
+        response, size, found = result
+        out.append(f"✅ {url}: {response.status_code}")
+        if response.status_code == 200:
+            out.append(f"   📄 Content length: {response.headers.get('Content-Length', size)} bytes")
+            if found:
+                out.append("   🎯 Found 'Aztec Protocol' in content")
+    if out:
+        log.info("\n".join(out))
 
 if __name__ == "__main__":
-    test_frontend() 
\ No newline at end of file
+    from _probe import configure_logging
+    configure_logging()
+    test_frontend()
\ No newline at end of file
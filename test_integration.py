@@ -3,62 +3,78 @@
 Test frontend-backend integration
 """
 
-import requests
-import time
+import logging
+
+log = logging.getLogger("probe")
 
 def test_integration():
     """Test if frontend and backend are properly connected"""
-    print("🔗 Testing Frontend-Backend Integration...")
-    print("=" * 50)
+    from _probe import FRONTEND_URL, BACKEND_URL, probe_all
+    
+    log.info("🔗 Testing Frontend-Backend Integration...\n%s", "=" * 50)
+    
+    # The three probes are independent: issue them together (pipelined per port), then check in order
+    urls = (f"{BACKEND_URL}/health", FRONTEND_URL, f"{BACKEND_URL}/api/v1/")
+    backend, frontend, api = probe_all(urls)
     
     # Test backend health
     try:
-        response = requests.get("http://localhost:8000/health", timeout=5)
-        if response.status_code == 200:
-            print("✅ Backend: Running on http://localhost:8000")
+        status = backend
+        if isinstance(status, Exception):
+            raise status
+        if status == 200:
+            log.info("✅ Backend: Running on http://localhost:8000")
         else:
-            print(f"❌ Backend: Status {response.status_code}")
+            log.error("❌ Backend: Status %s", status)
             return False
     except Exception as e:
-        print(f"❌ Backend: Not accessible - {e}")
+        log.error("❌ Backend: Not accessible - %s", e)
         return False
     
     # Test frontend accessibility
     try:
-        response = requests.get("http://localhost:3000", timeout=5)
-        if response.status_code == 200:
-            print("✅ Frontend: Running on http://localhost:3000")
+        status = frontend
+        if isinstance(status, Exception):
+            raise status
+        if status == 200:
+            log.info("✅ Frontend: Running on http://localhost:3000")
         else:
-            print(f"❌ Frontend: Status {response.status_code}")
+            log.error("❌ Frontend: Status %s", status)
             return False
     except Exception as e:
-        print(f"❌ Frontend: Not accessible - {e}")
+        log.error("❌ Frontend: Not accessible - %s", e)
         return False
     
     # Test API endpoints
     try:
-        response = requests.get("http://localhost:8000/api/v1/", timeout=5)
-        if response.status_code == 200:
-            print("✅ API: Endpoints accessible")
+        status = api
+        if isinstance(status, Exception):
+            raise status
+        if status == 200:
+            log.info("✅ API: Endpoints accessible")
         else:
-            print(f"❌ API: Status {response.status_code}")
+            log.error("❌ API: Status %s", status)
             return False
     except Exception as e:
-        print(f"❌ API: Not accessible - {e}")
+        log.error("❌ API: Not accessible - %s", e)
         return False
     
-    print("\n🎉 Integration Test Results:")
-    print("✅ Backend: http://localhost:8000")
-    print("✅ Frontend: http://localhost:3000")
-    print("✅ API: http://localhost:8000/api/v1/")
-    print("\n📱 You can now:")
-    print("   • Open http://localhost:3000 in your browser")
-    print("   • Register/login through the authentication system")
-    print("   • Browse all pages and use the full application")
-    print("   • View real-time data from the backend")
-    print("   • Access training results and analytics")
+    log.info(
+        "\n🎉 Integration Test Results:\n"
+        "✅ Backend: http://localhost:8000\n"
+        "✅ Frontend: http://localhost:3000\n"
+        "✅ API: http://localhost:8000/api/v1/\n"
+        "\n📱 You can now:\n"
+        "   • Open http://localhost:3000 in your browser\n"
+        "   • Register/login through the authentication system\n"
+        "   • Browse all pages and use the full application\n"
+        "   • View real-time data from the backend\n"
+        "   • Access training results and analytics"
+    )
     
     return True
 
 if __name__ == "__main__":
-    test_integration() 
\ No newline at end of file
+    from _probe import configure_logging
+    configure_logging()
+    test_integration()
\ No newline at end of file
@@ -3,34 +3,41 @@
 Test the landing page functionality
 """
 
-import requests
-import time
+import logging
+
+log = logging.getLogger("probe")
 
 def test_landing_page():
     """Test the landing page"""
-    print("🌐 Testing Landing Page...")
+    from _probe import AZTEC, CREATE_ACCOUNT, FRONTEND_URL, LANDING_NEEDLES, LANDING_PAGE, SIGN_IN, fetch
+    
+    log.info("🌐 Testing Landing Page...")
     
     try:
-        response = requests.get("http://localhost:3000/index.html", timeout=5)
+        result = fetch(FRONTEND_URL + LANDING_PAGE, LANDING_NEEDLES)
+        if isinstance(result, Exception):
+            raise result
+        response, _, found = result
         if response.status_code == 200:
-            print("✅ Landing page accessible")
+            log.info("✅ Landing page accessible")
             
             # Check if it contains registration and login forms
-            content = response.text
-            if "Create Account" in content and "Sign In" in content:
-                print("✅ Registration and login forms present")
+            if CREATE_ACCOUNT in found and SIGN_IN in found:
+                log.info("✅ Registration and login forms present")
             else:
-                print("❌ Registration/login forms missing")
+                log.error("❌ Registration/login forms missing")
                 
-            if "Aztec Protocol" in content:
-                print("✅ Aztec Protocol branding present")
+            if AZTEC in found:
+                log.info("✅ Aztec Protocol branding present")
             else:
-                print("❌ Branding missing")
+                log.error("❌ Branding missing")
                 
         else:
-            print(f"❌ Landing page returned status: {response.status_code}")
+            log.error("❌ Landing page returned status: %d", response.status_code)
     except Exception as e:
-        print(f"❌ Landing page not accessible: {e}")
+        log.error("❌ Landing page not accessible: %s", e)
 
 if __name__ == "__main__":
-    test_landing_page() 
\ No newline at end of file
+    from _probe import configure_logging
+    configure_logging()
+    test_landing_page()
\ No newline at end of file